@@ -1,3 +1,5 @@
+import atexit
+import hashlib
 import json
 import os
 import sqlite3
@@ -5,10 +7,11 @@ from datetime import datetime, timedelta
 from html.parser import HTMLParser
 import re
 from pathlib import Path
+import threading
 import time
+import uuid
+from collections import OrderedDict
 from werkzeug.utils import secure_filename
-from urllib import request as urlrequest
-from urllib.error import HTTPError, URLError
 
 try:
     from dotenv import load_dotenv
@@ -25,10 +28,8 @@ except ModuleNotFoundError:  # pragma: no cover - fallback loader
                 continue
             key, value = stripped.split("=", 1)
             os.environ.setdefault(key.strip(), value.strip())
-from flask import Flask, redirect, render_template, request, url_for, Response, send_file
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+import click
+from flask import Flask, jsonify, redirect, render_template, request, url_for, Response, send_file
 
 load_dotenv()
 
@@ -41,6 +42,9 @@ LEGACY_LOCAL_DATA_DIR = BASE_DIR / "local_data"
 MEDIA_UPLOADS_DIR = BASE_DIR / "static" / "uploads"
 BOOKS_FILE = DATA_DIR / "books.json"
 LOCAL_BOOKS_FILE = LOCAL_DATA_DIR / "books.json"
+LOCAL_BOOKS_LOG = LOCAL_DATA_DIR / "books.log.jsonl"
+BOOKS_LOG_COMPACT_BYTES = 256 * 1024
+BOOKS_LOG_LOCK = threading.Lock()
 LEGACY_LOCAL_BOOKS_FILE = LEGACY_LOCAL_DATA_DIR / "books.json"
 CALMING_COUNTS_FILE = LOCAL_DATA_DIR / "calming_counts.json"
 CF_API_TOKEN = os.getenv("CF_API_TOKEN", "YOUR_TOKEN_HERE")
@@ -220,8 +224,7 @@ def remove_local_media_file(url):
         return
 
 
-def load_books_file():
-    ensure_local_data_dir()
+def read_books_snapshot():
     if not LOCAL_BOOKS_FILE.exists():
         return None
 
@@ -236,6 +239,102 @@ def load_books_file():
     return None
 
 
+def replay_books_log(books):
+    """Apply the change log on top of a snapshot, skipping a torn final line."""
+
+    if not LOCAL_BOOKS_LOG.exists():
+        return books
+
+    by_key = {book_dedupe_key(book): book_record(book) for book in books or []}
+
+    with LOCAL_BOOKS_LOG.open() as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+
+            op = entry.get("op")
+            if op == "upsert":
+                book = book_record(entry.get("book") or {})
+                key = book_dedupe_key(book)
+                existing = by_key.get(key)
+                if existing is None:
+                    by_key[key] = book
+                elif not existing.get("cover_url") and book.get("cover_url"):
+                    existing["cover_url"] = book["cover_url"]
+            elif op == "update":
+                book = book_record(entry.get("book") or {})
+                old_key = entry.get("key")
+                if old_key in by_key:
+                    by_key = {
+                        (book_dedupe_key(book) if key == old_key else key): (
+                            book if key == old_key else value
+                        )
+                        for key, value in by_key.items()
+                    }
+                else:
+                    by_key[book_dedupe_key(book)] = book
+            elif op == "delete":
+                by_key.pop(entry.get("key"), None)
+
+    return list(by_key.values())
+
+
+def load_books_file():
+    ensure_local_data_dir()
+    snapshot = read_books_snapshot()
+    if snapshot is None and not LOCAL_BOOKS_LOG.exists():
+        return None
+
+    return replay_books_log(snapshot or [])
+
+
+def write_atomic(path, text):
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with temp_path.open("w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def write_books_snapshot(books):
+    """Replace the local mirror with a full snapshot and start a fresh log."""
+
+    ensure_local_data_dir()
+    with BOOKS_LOG_LOCK:
+        write_atomic(LOCAL_BOOKS_FILE, json.dumps([book_record(book) for book in books], indent=2))
+        write_atomic(LOCAL_BOOKS_LOG, "")
+
+
+def compact_books_log():
+    ensure_local_data_dir()
+    with BOOKS_LOG_LOCK:
+        books = replay_books_log(read_books_snapshot() or [])
+        # Every log operation is idempotent, so a crash between these two
+        # renames only means the next replay re-applies entries already folded in.
+        write_atomic(LOCAL_BOOKS_FILE, json.dumps(books, indent=2))
+        write_atomic(LOCAL_BOOKS_LOG, "")
+
+
+def append_books_log(*entries):
+    ensure_local_data_dir()
+    payload = "".join(json.dumps(entry) + "\n" for entry in entries)
+
+    with BOOKS_LOG_LOCK:
+        with LOCAL_BOOKS_LOG.open("a") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        log_size = LOCAL_BOOKS_LOG.stat().st_size
+
+    if log_size > BOOKS_LOG_COMPACT_BYTES:
+        compact_books_log()
+
+
 def slugify(value):
     return "-".join(value.lower().split())
 
@@ -268,22 +367,124 @@ def normalize_support_link(url):
     return f"https://{url}"
 
 
+# Every outbound HTTP call goes through one pooled session. Each host gets a
+# concurrency cap so bursts (catalogue warming, bulk scrapes) can't trip rate limits.
+HTTP_DEFAULT_TIMEOUT = (5, 20)
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+HTTP_DEFAULT_HOST_LIMIT = 4
+HTTP_HOST_LIMITS = {
+    "api.cloudflare.com": 16,
+    "api.deepseek.com": 8,
+    "www.googleapis.com": 4,
+}
+HTTP_SESSION = None
+HTTP_HOST_SEMAPHORES = {}
+HTTP_STATS = {}
+HTTP_LOCK = threading.Lock()
+
+
+def http_session():
+    global HTTP_SESSION
+
+    with HTTP_LOCK:
+        if HTTP_SESSION is None:
+            import requests as req_lib
+            from requests.adapters import HTTPAdapter
+
+            session = req_lib.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            HTTP_SESSION = session
+    return HTTP_SESSION
+
+
+def http_host_slot(host):
+    with HTTP_LOCK:
+        semaphore = HTTP_HOST_SEMAPHORES.get(host)
+        if semaphore is None:
+            limit = HTTP_HOST_LIMITS.get(host, HTTP_DEFAULT_HOST_LIMIT)
+            semaphore = HTTP_HOST_SEMAPHORES[host] = threading.BoundedSemaphore(limit)
+            HTTP_STATS[host] = {"requests": 0, "errors": 0, "seconds": 0.0, "wait_seconds": 0.0}
+    return semaphore
+
+
+def http_request(method, url, timeout=None, **kwargs):
+    """Send a request on the shared session, holding a per-host slot until headers arrive.
+
+    Streamed bodies are read after the slot is released, so a slow download
+    never blocks the host's other requests from starting.
+    """
+
+    from urllib.parse import urlparse
+
+    host = (urlparse(url).hostname or "").lower()
+    slot = http_host_slot(host)
+    session = http_session()
+
+    queued_at = time.perf_counter()
+    with slot:
+        started = time.perf_counter()
+        try:
+            return session.request(method, url, timeout=timeout or HTTP_DEFAULT_TIMEOUT, **kwargs)
+        except Exception:
+            with HTTP_LOCK:
+                HTTP_STATS[host]["errors"] += 1
+            raise
+        finally:
+            finished = time.perf_counter()
+            with HTTP_LOCK:
+                stats = HTTP_STATS[host]
+                stats["requests"] += 1
+                stats["seconds"] += finished - started
+                stats["wait_seconds"] += started - queued_at
+
+
+def http_summary():
+    with HTTP_LOCK:
+        return {
+            host: {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "avg_ms": round(stats["seconds"] * 1000 / stats["requests"], 1) if stats["requests"] else None,
+                "avg_wait_ms": round(stats["wait_seconds"] * 1000 / stats["requests"], 1)
+                if stats["requests"]
+                else None,
+                "limit": HTTP_HOST_LIMITS.get(host, HTTP_DEFAULT_HOST_LIMIT),
+            }
+            for host, stats in HTTP_STATS.items()
+        }
+
+
+# Book metadata lives in <head>, so scrapes stop reading at </head> or <body>
+# and never pull more than SCRAPE_MAX_HEAD_BYTES from the origin.
+SCRAPE_MAX_HEAD_BYTES = int(os.getenv("SCRAPE_MAX_HEAD_BYTES", str(512 * 1024)))
+SCRAPE_CHUNK_BYTES = 16 * 1024
+
+
 class MetaTagParser(HTMLParser):
     def __init__(self):
         super().__init__()
         self.meta_tags = []
         self.title_chunks = []
         self._in_title = False
+        self.head_done = False
 
     def handle_starttag(self, tag, attrs):
+        if self.head_done:
+            return
         if tag.lower() == "meta":
             self.meta_tags.append({key.lower(): value for key, value in attrs if value})
         elif tag.lower() == "title":
             self._in_title = True
+        elif tag.lower() == "body":
+            self.head_done = True
 
     def handle_endtag(self, tag):
         if tag.lower() == "title":
             self._in_title = False
+        elif tag.lower() == "head":
+            self.head_done = True
 
     def handle_data(self, data):
         if self._in_title:
@@ -296,6 +497,24 @@ def parse_meta_tags(html):
     return parser.meta_tags, "".join(parser.title_chunks).strip()
 
 
+def parse_meta_tags_stream(chunks, charset="utf-8", max_bytes=None):
+    """Decode and parse byte chunks until the head ends or ``max_bytes`` have been read."""
+
+    import codecs
+
+    max_bytes = max_bytes or SCRAPE_MAX_HEAD_BYTES
+    decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    parser = MetaTagParser()
+    bytes_read = 0
+    for chunk in chunks:
+        chunk = chunk[: max_bytes - bytes_read]
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.head_done or bytes_read >= max_bytes:
+            break
+    return parser.meta_tags, "".join(parser.title_chunks).strip()
+
+
 def first_meta_content(meta_tags, names):
     names = {name.lower() for name in names}
     for tag in meta_tags:
@@ -321,8 +540,35 @@ def extract_html_charset(headers, default="utf-8"):
     return default
 
 
+SELENIUM = None
+
+
+def load_selenium():
+    """Import Selenium on first use; only admin scraping ever needs a browser."""
+
+    global SELENIUM
+    if SELENIUM is None:
+        from types import SimpleNamespace
+
+        from selenium import webdriver
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        SELENIUM = SimpleNamespace(
+            webdriver=webdriver,
+            Options=Options,
+            By=By,
+            WebDriverWait=WebDriverWait,
+            TimeoutException=TimeoutException,
+        )
+    return SELENIUM
+
+
 def create_selenium_driver():
-    chrome_options = Options()
+    selenium = load_selenium()
+    chrome_options = selenium.Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
@@ -332,30 +578,116 @@ def create_selenium_driver():
     chrome_options.add_argument(
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
+    # Return from get() at DOMContentLoaded; wait_for_page_ready decides when the page is usable.
+    chrome_options.page_load_strategy = "eager"
+
+    driver = selenium.webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(CHROME_PAGE_TIMEOUT)
+    return driver
+
+
+# Headless Chrome is expensive to start, so a few drivers are kept warm and
+# lent out one scrape at a time. Each is replaced after CHROME_MAX_PAGES pages
+# or as soon as it stops responding.
+CHROME_POOL_SIZE = int(os.getenv("CHROME_POOL_SIZE", "2"))
+CHROME_MAX_PAGES = int(os.getenv("CHROME_MAX_PAGES", "50"))
+CHROME_PAGE_TIMEOUT = 15
+CHROME_POOL_IDLE = []
+CHROME_POOL_SLOTS = threading.BoundedSemaphore(CHROME_POOL_SIZE)
+CHROME_POOL_LOCK = threading.Lock()
+
+
+def quit_selenium_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def selenium_driver_alive(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def acquire_pooled_driver():
+    """Borrow a warm driver, starting a new one if none is idle; blocks while the pool is busy."""
+
+    CHROME_POOL_SLOTS.acquire()
+    with CHROME_POOL_LOCK:
+        entry = CHROME_POOL_IDLE.pop() if CHROME_POOL_IDLE else None
+    if entry is None:
+        try:
+            entry = {"driver": create_selenium_driver(), "pages": 0}
+        except Exception:
+            CHROME_POOL_SLOTS.release()
+            raise
+    return entry
+
+
+def release_pooled_driver(entry):
+    entry["pages"] += 1
+    try:
+        if entry["pages"] < CHROME_MAX_PAGES and selenium_driver_alive(entry["driver"]):
+            with CHROME_POOL_LOCK:
+                CHROME_POOL_IDLE.append(entry)
+        else:
+            quit_selenium_driver(entry["driver"])
+    finally:
+        CHROME_POOL_SLOTS.release()
+
+
+@atexit.register
+def shutdown_driver_pool():
+    with CHROME_POOL_LOCK:
+        idle = list(CHROME_POOL_IDLE)
+        CHROME_POOL_IDLE.clear()
+    for entry in idle:
+        quit_selenium_driver(entry["driver"])
+
 
-    return webdriver.Chrome(options=chrome_options)
+def wait_for_page_ready(driver, css_selector=None, timeout=CHROME_PAGE_TIMEOUT):
+    """Wait until the document has loaded and ``css_selector`` (if any) is present.
+
+    A timeout is not an error: callers scrape whatever has rendered by then.
+    """
+
+    selenium = load_selenium()
+
+    def ready(current_driver):
+        if current_driver.execute_script("return document.readyState") != "complete":
+            return False
+        return not css_selector or bool(current_driver.find_elements(selenium.By.CSS_SELECTOR, css_selector))
+
+    try:
+        selenium.WebDriverWait(driver, timeout, poll_frequency=0.1).until(ready)
+    except selenium.TimeoutException:
+        pass
 
 
 def fetch_html_with_browser(url):
     """Fetch page HTML using a real browser to bypass strict blocking."""
 
-    driver = None
     try:
-        driver = create_selenium_driver()
+        entry = acquire_pooled_driver()
+    except Exception as exc:  # pragma: no cover - depends on browser availability
+        return None, str(exc)
+
+    try:
+        driver = entry["driver"]
         driver.get(url)
-        time.sleep(4)
+        wait_for_page_ready(driver)
         return driver.page_source, None
     except Exception as exc:  # pragma: no cover - depends on browser availability
         return None, str(exc)
     finally:
-        try:
-            if driver:
-                driver.quit()
-        except Exception:
-            pass
+        release_pooled_driver(entry)
 
 
 def extract_bookshop_title(driver):
+    By = load_selenium().By
     try:
         element = driver.find_element(By.CSS_SELECTOR, "h1[data-testid='book-title']")
         if element and element.text.strip():
@@ -410,6 +742,7 @@ def extract_bookshop_title(driver):
 
 
 def extract_bookshop_author(driver):
+    By = load_selenium().By
     selectors = [
         "a[href*='/search?keywords=']",
         ".author",
@@ -435,6 +768,7 @@ def extract_bookshop_author(driver):
 
 
 def extract_bookshop_description(driver):
+    By = load_selenium().By
     selectors = [
         "div.bulleted-lists[dir='ltr']",
         ".description",
@@ -457,6 +791,7 @@ def extract_bookshop_description(driver):
 
 
 def extract_bookshop_image(driver):
+    By = load_selenium().By
     selectors = [
         "img[alt*='bookcover']",
         "img[alt*='cover']",
@@ -485,15 +820,15 @@ def extract_bookshop_image(driver):
 
 
 def scrape_bookshop_metadata(book_url):
-    driver = None
     try:
-        driver = create_selenium_driver()
+        entry = acquire_pooled_driver()
     except Exception as exc:
         return None, f"Failed to initialize Chrome driver: {exc}"
 
     try:
+        driver = entry["driver"]
         driver.get(book_url)
-        time.sleep(4)
+        wait_for_page_ready(driver, "h1")
 
         title = extract_bookshop_title(driver)
         author = extract_bookshop_author(driver) or "Unknown author"
@@ -516,17 +851,90 @@ def scrape_bookshop_metadata(book_url):
     except Exception as exc:
         return None, f"Error while scraping book details: {exc}"
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        release_pooled_driver(entry)
+
+
+# Successful scrapes are cached locally by normalised URL so repeats skip the
+# network and Selenium entirely; force_refresh bypasses and overwrites the entry.
+SCRAPE_CACHE_TTL_SECONDS = int(os.getenv("SCRAPE_CACHE_TTL_SECONDS", str(30 * 86400)))
+SCRAPE_CACHE_READY = False
+SCRAPE_CACHE_STATS = {"hits": 0, "misses": 0}
+SCRAPE_CACHE_LOCK = threading.Lock()
+
+
+def ensure_scrape_cache_schema():
+    global SCRAPE_CACHE_READY
+    if SCRAPE_CACHE_READY:
+        return
+
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                url TEXT PRIMARY KEY,
+                book_json TEXT NOT NULL,
+                scraped_at REAL NOT NULL
+            );
+            """
+        )
+    SCRAPE_CACHE_READY = True
+
+
+def find_cached_scrape(normalized_url):
+    ensure_scrape_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT book_json FROM scrape_cache WHERE url = ? AND scraped_at > ?",
+            [normalized_url, time.time() - SCRAPE_CACHE_TTL_SECONDS],
+        ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def remember_scrape(normalized_url, book):
+    ensure_scrape_cache_schema()
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            INSERT INTO scrape_cache (url, book_json, scraped_at) VALUES (?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET book_json = excluded.book_json, scraped_at = excluded.scraped_at
+            """,
+            [normalized_url, json.dumps(book), time.time()],
+        )
 
 
-def scrape_book_metadata(book_url):
+def scrape_cache_summary():
+    ensure_scrape_cache_schema()
+    with open_local_db() as connection:
+        entries = connection.execute(
+            "SELECT COUNT(*) FROM scrape_cache WHERE scraped_at > ?",
+            [time.time() - SCRAPE_CACHE_TTL_SECONDS],
+        ).fetchone()[0]
+    with SCRAPE_CACHE_LOCK:
+        stats = dict(SCRAPE_CACHE_STATS)
+    return {**stats, "entries": entries, "ttl_seconds": SCRAPE_CACHE_TTL_SECONDS}
+
+
+def scrape_book_metadata(book_url, force_refresh=False):
     normalized_url = normalize_url(book_url)
     if not normalized_url:
         return None, "Please provide a book URL."
 
+    if not force_refresh:
+        cached = find_cached_scrape(normalized_url)
+        if cached:
+            with SCRAPE_CACHE_LOCK:
+                SCRAPE_CACHE_STATS["hits"] += 1
+            return cached, None
+
+    with SCRAPE_CACHE_LOCK:
+        SCRAPE_CACHE_STATS["misses"] += 1
+    book, error = fetch_book_metadata(normalized_url)
+    if book:
+        remember_scrape(normalized_url, book)
+    return book, error
+
+
+def fetch_book_metadata(normalized_url):
     if "uk.bookshop.org" in normalized_url:
         return scrape_bookshop_metadata(normalized_url)
 
@@ -535,30 +943,29 @@ def scrape_book_metadata(book_url):
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
         "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
     }
-    request = urlrequest.Request(normalized_url, headers=headers)
+    import requests as req_lib
 
-    html = None
+    meta_tags = None
 
     try:
-        with urlrequest.urlopen(request, timeout=10) as response:  # nosec B310
-            charset = extract_html_charset(response.headers)
-            html = response.read().decode(charset, errors="replace")
-    except HTTPError as exc:
-        if exc.code in {403, 429}:
-            html, browser_error = fetch_html_with_browser(normalized_url)
-            if not html:
-                return None, (
-                    f"Unable to fetch book page (HTTP {exc.code}) and browser fallback failed: {browser_error}"
+        response = http_request("GET", normalized_url, headers=headers, timeout=10, stream=True)
+        with response:
+            blocked_status = response.status_code if response.status_code in {403, 429} else None
+            if not blocked_status:
+                response.raise_for_status()
+                meta_tags, title_from_markup = parse_meta_tags_stream(
+                    response.iter_content(SCRAPE_CHUNK_BYTES), extract_html_charset(response.headers)
                 )
-        else:
-            return None, f"Unable to fetch book page: {exc}"
-    except (URLError, TimeoutError, UnicodeDecodeError) as exc:
+    except (req_lib.RequestException, LookupError) as exc:
         return None, f"Unable to fetch book page: {exc}"
 
-    if html is None:
-        return None, "Unable to fetch book page: Unknown error"
-
-    meta_tags, title_from_markup = parse_meta_tags(html)
+    if meta_tags is None:
+        html, browser_error = fetch_html_with_browser(normalized_url)
+        if not html:
+            return None, (
+                f"Unable to fetch book page (HTTP {blocked_status}) and browser fallback failed: {browser_error}"
+            )
+        meta_tags, title_from_markup = parse_meta_tags(html)
 
     title = first_meta_content(meta_tags, {"og:title", "twitter:title", "title"}) or title_from_markup
     description = first_meta_content(meta_tags, {"og:description", "description"})
@@ -579,6 +986,137 @@ def scrape_book_metadata(book_url):
     return book, None
 
 
+# Scrapes run as persisted background jobs so the admin request returns at once.
+# Jobs left queued or running by a restart are picked up again on first use.
+SCRAPE_JOB_WORKERS = int(os.getenv("SCRAPE_JOB_WORKERS", "2"))
+SCRAPE_JOB_EXECUTOR = None
+SCRAPE_JOBS_READY = False
+SCRAPE_JOBS_LOCK = threading.Lock()
+
+
+def scrape_job_executor():
+    global SCRAPE_JOB_EXECUTOR, SCRAPE_JOBS_READY
+
+    with SCRAPE_JOBS_LOCK:
+        if SCRAPE_JOBS_READY:
+            return SCRAPE_JOB_EXECUTOR
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with open_local_db() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scrape_jobs (
+                    id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    message TEXT,
+                    book_title TEXT,
+                    force_refresh INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                """
+            )
+            if "force_refresh" not in get_table_columns(connection, "scrape_jobs"):
+                connection.execute(
+                    "ALTER TABLE scrape_jobs ADD COLUMN force_refresh INTEGER NOT NULL DEFAULT 0"
+                )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS import_jobs (
+                    id TEXT PRIMARY KEY,
+                    urls_json TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    message TEXT,
+                    report_json TEXT,
+                    force_refresh INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                """
+            )
+            unfinished = [
+                (run_scrape_job, row[0])
+                for row in connection.execute(
+                    "SELECT id FROM scrape_jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+                )
+            ] + [
+                (run_import_job, row[0])
+                for row in connection.execute(
+                    "SELECT id FROM import_jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+                )
+            ]
+
+        SCRAPE_JOB_EXECUTOR = ThreadPoolExecutor(
+            max_workers=SCRAPE_JOB_WORKERS, thread_name_prefix="scrape-job"
+        )
+        for runner, job_id in unfinished:
+            SCRAPE_JOB_EXECUTOR.submit(runner, job_id)
+        SCRAPE_JOBS_READY = True
+        return SCRAPE_JOB_EXECUTOR
+
+
+def update_scrape_job(job_id, status, message=None, book_title=None):
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            UPDATE scrape_jobs
+            SET status = ?, message = ?, book_title = COALESCE(?, book_title), updated_at = ?
+            WHERE id = ?
+            """,
+            [status, message, book_title, time.time(), job_id],
+        )
+
+
+def enqueue_scrape_job(book_url, force_refresh=False):
+    executor = scrape_job_executor()
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            INSERT INTO scrape_jobs (id, url, status, force_refresh, created_at, updated_at)
+            VALUES (?, ?, 'queued', ?, ?, ?)
+            """,
+            [job_id, book_url, int(force_refresh), now, now],
+        )
+    executor.submit(run_scrape_job, job_id)
+    return job_id
+
+
+def load_scrape_job(job_id):
+    scrape_job_executor()
+    with open_local_db(sqlite3.Row) as connection:
+        row = connection.execute(
+            """
+            SELECT id, url, status, message, book_title, force_refresh, created_at, updated_at
+            FROM scrape_jobs WHERE id = ?
+            """,
+            [job_id],
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def run_scrape_job(job_id):
+    job = load_scrape_job(job_id)
+    if not job or job["status"] in {"done", "failed"}:
+        return
+
+    update_scrape_job(job_id, "running")
+    try:
+        book, error = scrape_book_metadata(job["url"], force_refresh=bool(job["force_refresh"]))
+        if error:
+            update_scrape_job(job_id, "failed", error)
+            return
+        insert_book(book)
+    except Exception as exc:
+        update_scrape_job(job_id, "failed", f"Error while scraping book details: {exc}")
+        return
+
+    update_scrape_job(job_id, "done", "Book scraped and added.", book["title"])
+
+
 def ensure_fallback_db():
     ensure_local_data_dir()
     if LOCAL_FALLBACK_DB.exists():
@@ -678,6 +1216,163 @@ def migrate_charities_schema_remote():
             )
 
 
+def assign_book_slugs(books):
+    """Give every book a unique slug, suffixing repeated titles with -2, -3, ..."""
+
+    taken = set()
+    for idx, book in enumerate(books):
+        base = book_slug(book, f"book-{idx}")
+        slug = base
+        suffix = 2
+        while slug in taken:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        taken.add(slug)
+        book["slug"] = slug
+    return books
+
+
+def book_dedupe_key(book):
+    return json.dumps(
+        [
+            (book.get("title") or "").strip().lower(),
+            (book.get("author") or "").strip().lower(),
+            (book.get("affiliate_url") or "").strip().lower(),
+        ]
+    )
+
+
+def plan_book_dedupe(rows):
+    """Work out how to collapse duplicate book rows onto the earliest copy.
+
+    Returns ``(key_updates, cover_updates, duplicate_ids)`` mirroring the
+    upsert merge rule: a survivor without a cover inherits one from a duplicate.
+    """
+
+    survivors = {}
+    key_updates = []
+    cover_updates = {}
+    duplicate_ids = []
+
+    for row in rows:
+        key = book_dedupe_key(row)
+        survivor = survivors.get(key)
+        if survivor is None:
+            survivors[key] = row
+            key_updates.append((key, row.get("id")))
+            continue
+
+        duplicate_ids.append(row.get("id"))
+        if not survivor.get("cover_url") and row.get("cover_url"):
+            survivor["cover_url"] = row.get("cover_url")
+            cover_updates[survivor.get("id")] = row.get("cover_url")
+
+    return key_updates, list(cover_updates.items()), duplicate_ids
+
+
+def book_slug_assignments(rows):
+    books = assign_book_slugs([dict(row) for row in rows])
+    return [(book["slug"], book.get("id")) for book in books]
+
+
+def migrate_books_schema_local(connection):
+    columns = get_table_columns(connection, "books")
+
+    if "slug" not in columns:
+        connection.execute("ALTER TABLE books ADD COLUMN slug TEXT")
+
+    missing = connection.execute(
+        "SELECT 1 FROM books WHERE slug IS NULL OR slug = '' LIMIT 1"
+    ).fetchone()
+    if missing:
+        rows = [
+            {"id": row[0], "title": row[1] or "", "author": row[2] or ""}
+            for row in connection.execute("SELECT id, title, author FROM books ORDER BY id")
+        ]
+        # Clear first so reassigned slugs never collide with stale ones mid-update.
+        connection.execute("UPDATE books SET slug = NULL")
+        for slug, book_id in book_slug_assignments(rows):
+            connection.execute("UPDATE books SET slug = ? WHERE id = ?", [slug, book_id])
+
+    connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_books_slug ON books(slug)")
+
+    if "dedupe_key" not in columns:
+        connection.execute("ALTER TABLE books ADD COLUMN dedupe_key TEXT")
+
+    missing = connection.execute(
+        "SELECT 1 FROM books WHERE dedupe_key IS NULL OR dedupe_key = '' LIMIT 1"
+    ).fetchone()
+    if missing:
+        rows = [
+            {
+                "id": row[0],
+                "title": row[1] or "",
+                "author": row[2] or "",
+                "affiliate_url": row[3] or "",
+                "cover_url": row[4] or "",
+            }
+            for row in connection.execute(
+                "SELECT id, title, author, affiliate_url, cover_url FROM books ORDER BY id"
+            )
+        ]
+        key_updates, cover_updates, duplicate_ids = plan_book_dedupe(rows)
+        for book_id in duplicate_ids:
+            connection.execute("DELETE FROM books WHERE id = ?", [book_id])
+        for book_id, cover_url in cover_updates:
+            connection.execute("UPDATE books SET cover_url = ? WHERE id = ?", [cover_url, book_id])
+        for key, book_id in key_updates:
+            connection.execute("UPDATE books SET dedupe_key = ? WHERE id = ?", [key, book_id])
+
+    connection.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_books_dedupe_key ON books(dedupe_key)"
+    )
+
+
+# The remote books migration costs several D1 round trips, so it runs once per
+# worker rather than on every ensure_tables() call.
+BOOKS_SCHEMA_REMOTE_READY = False
+
+
+def migrate_books_schema_remote():
+    global BOOKS_SCHEMA_REMOTE_READY
+    if not D1_CONFIGURED or BOOKS_SCHEMA_REMOTE_READY:
+        return
+
+    try:
+        columns = {row.get("name") for row in d1_query("PRAGMA table_info(books)")}
+    except Exception as exc:  # pragma: no cover - best-effort logging
+        print(f"Skipping D1 books migration; unable to inspect schema. Details: {exc}")
+        return
+
+    if "slug" not in columns:
+        d1_query("ALTER TABLE books ADD COLUMN slug TEXT")
+
+    if d1_query("SELECT 1 FROM books WHERE slug IS NULL OR slug = '' LIMIT 1"):
+        rows = d1_query("SELECT id, title, author FROM books ORDER BY id")
+        d1_query("UPDATE books SET slug = NULL")
+        for slug, book_id in book_slug_assignments(rows):
+            d1_query("UPDATE books SET slug = ? WHERE id = ?", [slug, book_id])
+
+    d1_query("CREATE UNIQUE INDEX IF NOT EXISTS idx_books_slug ON books(slug)")
+
+    if "dedupe_key" not in columns:
+        d1_query("ALTER TABLE books ADD COLUMN dedupe_key TEXT")
+
+    if d1_query("SELECT 1 FROM books WHERE dedupe_key IS NULL OR dedupe_key = '' LIMIT 1"):
+        rows = d1_query("SELECT id, title, author, affiliate_url, cover_url FROM books ORDER BY id")
+        key_updates, cover_updates, duplicate_ids = plan_book_dedupe(rows)
+        for book_id in duplicate_ids:
+            d1_query("DELETE FROM books WHERE id = ?", [book_id])
+        for book_id, cover_url in cover_updates:
+            d1_query("UPDATE books SET cover_url = ? WHERE id = ?", [cover_url, book_id])
+        for key, book_id in key_updates:
+            d1_query("UPDATE books SET dedupe_key = ? WHERE id = ?", [key, book_id])
+
+    d1_query("CREATE UNIQUE INDEX IF NOT EXISTS idx_books_dedupe_key ON books(dedupe_key)")
+    # An empty PRAGMA means D1 was unreachable; try again on the next call.
+    BOOKS_SCHEMA_REMOTE_READY = bool(columns)
+
+
 def migrate_useful_contacts_schema_local(connection):
     columns = get_table_columns(connection, "useful_contacts")
 
@@ -755,14 +1450,16 @@ def d1_query(sql, params=None):
         }
         payload = json.dumps({"sql": sql, "params": params}).encode()
 
+        import requests as req_lib
+
         try:
-            request = urlrequest.Request(D1_BASE_URL, data=payload, headers=headers, method="POST")
-            with urlrequest.urlopen(request, timeout=5) as response:  # nosec B310
-                data = json.loads(response.read().decode())
+            response = http_request("POST", D1_BASE_URL, data=payload, headers=headers, timeout=5)
+            response.raise_for_status()
+            data = response.json()
             if not data.get("success", False):
                 raise RuntimeError(data.get("errors", "Unknown D1 error"))
             return normalize_result_set(data.get("result"))
-        except (HTTPError, URLError, TimeoutError, RuntimeError, json.JSONDecodeError) as exc:
+        except (req_lib.RequestException, RuntimeError, ValueError) as exc:
             print(f"D1 query failed; using local fallback database. Details: {exc}")
             D1_AVAILABLE = False
 
@@ -784,7 +1481,9 @@ def ensure_tables():
             author TEXT NOT NULL,
             description TEXT NOT NULL,
             affiliate_url TEXT NOT NULL,
-            cover_url TEXT
+            cover_url TEXT,
+            slug TEXT,
+            dedupe_key TEXT
         );
         """,
         """
@@ -898,9 +1597,11 @@ def ensure_tables():
 
     # Apply schema migrations to keep legacy databases aligned with the current model.
     with open_local_db() as connection:
+        migrate_books_schema_local(connection)
         migrate_charities_schema_local(connection)
         migrate_useful_contacts_schema_local(connection)
 
+    migrate_books_schema_remote()
     migrate_charities_schema_remote()
     migrate_useful_contacts_schema_remote()
 
@@ -1026,7 +1727,19 @@ def normalize_calming_entry(entry):
     return {"completed": int(entry or 0), "views": 0}
 
 
+# Settings are read on every chat message, so they are cached briefly per worker.
+# Saves invalidate the local copy; other workers pick changes up within the TTL.
+SITE_SETTINGS_TTL_SECONDS = float(os.getenv("SITE_SETTINGS_TTL_SECONDS", "10"))
+SITE_SETTINGS_CACHE = {"settings": None, "loaded_at": 0.0}
+SITE_SETTINGS_LOCK = threading.Lock()
+
+
 def load_site_settings():
+    with SITE_SETTINGS_LOCK:
+        cached = SITE_SETTINGS_CACHE["settings"]
+        if cached is not None and time.monotonic() - SITE_SETTINGS_CACHE["loaded_at"] < SITE_SETTINGS_TTL_SECONDS:
+            return dict(cached)
+
     ensure_tables()
 
     rows = d1_query("SELECT setting_key, setting_value FROM site_settings")
@@ -1037,7 +1750,9 @@ def load_site_settings():
         if key:
             settings[key] = str(row.get("setting_value", ""))
 
-    return settings
+    with SITE_SETTINGS_LOCK:
+        SITE_SETTINGS_CACHE.update(settings=settings, loaded_at=time.monotonic())
+    return dict(settings)
 
 
 def save_site_setting(key, value):
@@ -1051,6 +1766,8 @@ def save_site_setting(key, value):
         """,
         [key, value],
     )
+    with SITE_SETTINGS_LOCK:
+        SITE_SETTINGS_CACHE["settings"] = None
 
 
 def construction_banner_enabled():
@@ -1066,25 +1783,218 @@ def get_deepseek_api_key():
     return load_site_settings().get(DEEPSEEK_SETTING_KEY, "")
 
 
-def chat_enabled():
-    value = load_site_settings().get(CHAT_ENABLED_KEY, "1")
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+# One client for every DeepSeek call: same endpoint, error mapping and metrics.
+# A slot is held for the whole completion, so chat bursts queue here instead of
+# opening a connection per message.
+DEEPSEEK_CHAT_URL = "https://api.deepseek.com/chat/completions"
+DEEPSEEK_MODEL = "deepseek-chat"
+DEEPSEEK_DEFAULT_TIMEOUT = (5, 30)
+DEEPSEEK_TIMEOUTS = {
+    "moderation": (5, 10),
+    "moderation_batch": (5, 10),
+    "names": (5, 15),
+}
+# Waiting for a slot is bounded too, and moderation gives up sooner so a burst
+# of chat replies can't stall /api/chat/check-message behind it.
+DEEPSEEK_DEFAULT_SLOT_WAIT = 15
+DEEPSEEK_SLOT_WAITS = {
+    "moderation": 3,
+    "moderation_batch": 3,
+}
+DEEPSEEK_MAX_IN_FLIGHT = HTTP_HOST_LIMITS["api.deepseek.com"]
+DEEPSEEK_SLOTS = threading.BoundedSemaphore(DEEPSEEK_MAX_IN_FLIGHT)
+DEEPSEEK_STATS = {}
+DEEPSEEK_LOCK = threading.Lock()
+DEEPSEEK_IN_FLIGHT = 0
+
+
+def record_deepseek_call(purpose, wait_seconds, seconds, error):
+    with DEEPSEEK_LOCK:
+        stats = DEEPSEEK_STATS.setdefault(
+            purpose,
+            {"calls": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0, "wait_seconds": 0.0},
+        )
+        stats["calls"] += 1
+        stats["errors"] += 1 if error else 0
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        stats["wait_seconds"] += wait_seconds
 
 
-def set_chat_enabled(enabled):
-    save_site_setting(CHAT_ENABLED_KEY, "1" if enabled else "0")
+def acquire_deepseek_slot(purpose):
+    """Wait for an in-flight slot; False (recorded as an error) if none frees up in time."""
 
+    queued_at = time.perf_counter()
+    if DEEPSEEK_SLOTS.acquire(timeout=DEEPSEEK_SLOT_WAITS.get(purpose, DEEPSEEK_DEFAULT_SLOT_WAIT)):
+        return True
+    record_deepseek_call(purpose, time.perf_counter() - queued_at, 0.0, "no free slot")
+    return False
 
-def get_chat_next_session():
-    return load_site_settings().get(CHAT_NEXT_SESSION_KEY, "")
 
+def deepseek_completion(api_key, messages, purpose, temperature, max_tokens=None):
+    """Run one chat completion and return (content, error).
 
-def set_chat_next_session(value):
-    save_site_setting(CHAT_NEXT_SESSION_KEY, value)
+    Errors are mapped to the same short messages for every caller; ``purpose``
+    picks the timeout and the metrics bucket.
+    """
 
+    global DEEPSEEK_IN_FLIGHT
+    import requests as req_lib
 
-def get_chat_topic():
-    return load_site_settings().get(CHAT_TOPIC_KEY, "General mental health support")
+    payload = {"model": DEEPSEEK_MODEL, "messages": messages, "temperature": temperature}
+    if max_tokens:
+        payload["max_tokens"] = max_tokens
+    request_headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+
+    content, error = None, None
+    queued_at = time.perf_counter()
+    if not acquire_deepseek_slot(purpose):
+        return None, "DeepSeek request timed out."
+    try:
+        started = time.perf_counter()
+        with DEEPSEEK_LOCK:
+            DEEPSEEK_IN_FLIGHT += 1
+        try:
+            response = http_request(
+                "POST",
+                DEEPSEEK_CHAT_URL,
+                data=json.dumps(payload).encode("utf-8"),
+                headers=request_headers,
+                timeout=DEEPSEEK_TIMEOUTS.get(purpose, DEEPSEEK_DEFAULT_TIMEOUT),
+            )
+            response.raise_for_status()
+            result = response.json()
+            choice = (result.get("choices") or [{}])[0] if isinstance(result, dict) else {}
+            content = (choice.get("message") or {}).get("content") or ""
+        except req_lib.HTTPError as exc:
+            error = f"DeepSeek request failed: {exc.response.reason or exc.response.status_code}"
+        except req_lib.Timeout:
+            error = "DeepSeek request timed out."
+        except ValueError:
+            error = "Unable to parse DeepSeek response."
+        except req_lib.RequestException:
+            error = "Unable to reach DeepSeek API."
+        finally:
+            finished = time.perf_counter()
+            with DEEPSEEK_LOCK:
+                DEEPSEEK_IN_FLIGHT -= 1
+    finally:
+        DEEPSEEK_SLOTS.release()
+
+    record_deepseek_call(purpose, started - queued_at, finished - started, error)
+    return content, error
+
+
+def deepseek_completion_stream(api_key, messages, purpose, temperature, max_tokens=None):
+    """Stream a chat completion, yielding ``(delta, None)`` pieces and finally ``(None, error)`` on failure.
+
+    The DeepSeek slot is held until the stream finishes or the consumer closes it.
+    """
+
+    global DEEPSEEK_IN_FLIGHT
+    import requests as req_lib
+
+    payload = {"model": DEEPSEEK_MODEL, "messages": messages, "temperature": temperature, "stream": True}
+    if max_tokens:
+        payload["max_tokens"] = max_tokens
+    request_headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+        "Accept": "text/event-stream",
+    }
+
+    error = None
+    queued_at = time.perf_counter()
+    if not acquire_deepseek_slot(purpose):
+        yield None, "DeepSeek request timed out."
+        return
+    try:
+        started = time.perf_counter()
+        with DEEPSEEK_LOCK:
+            DEEPSEEK_IN_FLIGHT += 1
+        try:
+            response = http_request(
+                "POST",
+                DEEPSEEK_CHAT_URL,
+                data=json.dumps(payload).encode("utf-8"),
+                headers=request_headers,
+                timeout=DEEPSEEK_TIMEOUTS.get(purpose, DEEPSEEK_DEFAULT_TIMEOUT),
+                stream=True,
+            )
+            with response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    line = line.decode("utf-8", "replace").strip() if isinstance(line, bytes) else line.strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+                    event = json.loads(data)
+                    choice = (event.get("choices") or [{}])[0] if isinstance(event, dict) else {}
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        yield delta, None
+        except req_lib.HTTPError as exc:
+            error = f"DeepSeek request failed: {exc.response.reason or exc.response.status_code}"
+        except req_lib.Timeout:
+            error = "DeepSeek request timed out."
+        except ValueError:
+            error = "Unable to parse DeepSeek response."
+        except req_lib.RequestException:
+            error = "Unable to reach DeepSeek API."
+        finally:
+            finished = time.perf_counter()
+            with DEEPSEEK_LOCK:
+                DEEPSEEK_IN_FLIGHT -= 1
+            record_deepseek_call(purpose, started - queued_at, finished - started, error)
+    finally:
+        DEEPSEEK_SLOTS.release()
+
+    if error:
+        yield None, error
+
+
+def deepseek_summary():
+    with DEEPSEEK_LOCK:
+        return {
+            "in_flight": DEEPSEEK_IN_FLIGHT,
+            "max_in_flight": DEEPSEEK_MAX_IN_FLIGHT,
+            "calls": {
+                purpose: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["seconds"] * 1000 / stats["calls"], 1),
+                    "max_ms": round(stats["max_seconds"] * 1000, 1),
+                    "avg_wait_ms": round(stats["wait_seconds"] * 1000 / stats["calls"], 1),
+                }
+                for purpose, stats in DEEPSEEK_STATS.items()
+            },
+        }
+
+
+def chat_enabled():
+    value = load_site_settings().get(CHAT_ENABLED_KEY, "1")
+    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def set_chat_enabled(enabled):
+    save_site_setting(CHAT_ENABLED_KEY, "1" if enabled else "0")
+
+
+def get_chat_next_session():
+    return load_site_settings().get(CHAT_NEXT_SESSION_KEY, "")
+
+
+def set_chat_next_session(value):
+    save_site_setting(CHAT_NEXT_SESSION_KEY, value)
+
+
+def get_chat_topic():
+    return load_site_settings().get(CHAT_TOPIC_KEY, "General mental health support")
 
 
 def set_chat_topic(value):
@@ -1112,6 +2022,7 @@ def get_chat_blocked_words():
 
 def set_chat_blocked_words(value):
     save_site_setting(CHAT_BLOCKED_WORDS_KEY, value)
+    blocked_words_matcher(value)
 
 
 def get_chat_block_action():
@@ -1144,40 +2055,127 @@ def set_sleep_video_urls(urls):
         save_site_setting(key, normalize_url(url))
 
 
+# The blocked-words list is compiled once into a pair of trie-shaped regexes and
+# only rebuilt when the list changes. Messages and phrases are normalised the
+# same way (case, leetspeak, punctuation/spacing). Runs of single-character
+# tokens ("k i l l", "k.i.l.l") are joined back into words, and a second pattern
+# of the phrases without spaces catches those runs; ordinary words are never
+# joined, so phrases can't match across word boundaries.
+BLOCKED_WORDS_LEET = str.maketrans(
+    {"0": "o", "1": "i", "!": "i", "|": "i", "3": "e", "4": "a", "@": "a", "5": "s", "$": "s", "7": "t", "8": "b"}
+)
+BLOCKED_WORDS_MATCHER = {"source": None, "spaced": None, "compact": None}
+BLOCKED_WORDS_LOCK = threading.Lock()
+
+
+BLOCKED_WORDS_SPELLED_OUT = re.compile(r"(?<![^ ])\w(?: \w(?![^ ]))+")
+
+
+def normalize_blocked_text(text):
+    """Fold case and leetspeak and collapse punctuation/spacing runs to single spaces."""
+
+    return re.sub(r"[\W_]+", " ", text.lower().translate(BLOCKED_WORDS_LEET)).strip()
+
+
+def join_spelled_out(text):
+    """Join runs of single-character tokens: "k i l l myself" -> "kill myself"."""
+
+    return BLOCKED_WORDS_SPELLED_OUT.sub(lambda match: match.group().replace(" ", ""), text)
+
+
+def trie_pattern(phrases):
+    """Build one regex source matching any phrase, sharing common prefixes like a trie."""
+
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def render(node):
+        # A phrase ending here already matches; longer continuations add nothing.
+        if "" in node:
+            return ""
+        singles = sorted(char for char, child in node.items() if "" in child)
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if "" not in child]
+        if len(singles) == 1:
+            branches.insert(0, re.escape(singles[0]))
+        elif singles:
+            branches.insert(0, "[" + "".join(re.escape(char) for char in singles) + "]")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return render(trie) if trie else None
+
+
+def trie_regex(phrases):
+    pattern = trie_pattern(phrases)
+    return re.compile(pattern) if pattern else None
+
+
+def compile_blocked_words(blocked_words):
+    words, phrases, compact = set(), set(), set()
+    for phrase in (blocked_words or "").split(","):
+        spaced_phrase = normalize_blocked_text(phrase)
+        if spaced_phrase:
+            (phrases if " " in spaced_phrase else words).add(spaced_phrase)
+            compact.add(spaced_phrase.replace(" ", ""))
+
+    # Single words keep the old substring behaviour; multi-word phrases must start
+    # and end on word boundaries so "yourself, harmless" isn't "self harm".
+    parts = []
+    if words:
+        parts.append(trie_pattern(words))
+    if phrases:
+        parts.append(rf"\b{trie_pattern(phrases)}\b")
+    spaced = re.compile("|".join(parts)) if parts else None
+    return spaced, trie_regex(compact)
+
+
+def blocked_words_matcher(blocked_words=None):
+    """Return the compiled (spaced, compact) patterns, rebuilding only if the list changed."""
+
+    if blocked_words is None:
+        blocked_words = get_chat_blocked_words()
+    with BLOCKED_WORDS_LOCK:
+        if BLOCKED_WORDS_MATCHER["source"] != blocked_words:
+            spaced, compact = compile_blocked_words(blocked_words)
+            BLOCKED_WORDS_MATCHER.update(source=blocked_words, spaced=spaced, compact=compact)
+        return BLOCKED_WORDS_MATCHER["spaced"], BLOCKED_WORDS_MATCHER["compact"]
+
+
+def contains_blocked_words(message, patterns):
+    spaced_pattern, compact_pattern = patterns
+    if spaced_pattern is None:
+        return False
+    text = join_spelled_out(normalize_blocked_text(message))
+    return bool(spaced_pattern.search(text) or compact_pattern.search(text))
+
+
 def check_message_content_basic(message):
     """Basic keyword check for blocked content. Returns (is_safe, warning_message)"""
     if not message:
         return True, None
-    
-    message_lower = message.lower().strip()
-    blocked_words = get_chat_blocked_words()
-    
-    if not blocked_words:
-        return True, None
-    
-    # Split by comma and check each phrase
-    blocked_list = [word.strip().lower() for word in blocked_words.split(",") if word.strip()]
-    
-    for blocked in blocked_list:
-        if blocked in message_lower:
-            return False, "blocked_word"
-    
-    return True, None
 
+    if contains_blocked_words(message, blocked_words_matcher()):
+        return False, "blocked_word"
+
+    return True, None
 
-def ai_moderate_message(message, api_key):
-    """Use AI to check message for rule violations. Returns (is_safe, violation_type)"""
-    if not api_key or not message:
-        return True, None
-    
-    moderation_prompt = """You are a chat room moderator for a mental health support community. 
-Analyze this message and determine if it violates ANY of these rules:
 
-1. CONTACT INFO: Any phone numbers, emails, social media handles, addresses, or attempts to share contact info (even disguised like "my insta is..." or "add me on..." or using spaces/symbols to hide it like "1 2 3 4 5 6 7 8 9 0")
+MODERATION_RULES = """1. CONTACT INFO: Any phone numbers, emails, social media handles, addresses, or attempts to share contact info (even disguised like "my insta is..." or "add me on..." or using spaces/symbols to hide it like "1 2 3 4 5 6 7 8 9 0")
 2. MEETING REQUESTS: Asking to meet in person, suggesting meeting up, or trying to arrange offline contact
 3. SEXUAL CONTENT: Any sexual talk, innuendos, flirting, suggestive comments, or inappropriate content
 4. OFFENSIVE CONTENT: Slurs, hate speech, discriminatory language, bullying, or content that could offend
-5. HARMFUL CONTENT: Instructions for self-harm, dangerous activities, or encouraging harmful behavior
+5. HARMFUL CONTENT: Instructions for self-harm, dangerous activities, or encouraging harmful behavior"""
+
+
+def ai_moderation_verdict(message, api_key):
+    """Ask DeepSeek for a verdict. Returns ((is_safe, violation_type), error)."""
+    moderation_prompt = """You are a chat room moderator for a mental health support community. 
+Analyze this message and determine if it violates ANY of these rules:
+
+{rules}
 
 Message to check: "{message}"
 
@@ -1191,47 +2189,340 @@ Respond with ONLY a JSON object:
 
 Be strict. Even subtle attempts to bypass rules should be flagged."""
 
-    payload = {
-        "model": "deepseek-chat",
-        "messages": [
+    content, error = deepseek_completion(
+        api_key,
+        [
             {"role": "system", "content": "You are a strict chat moderator. Respond only with JSON."},
-            {"role": "user", "content": moderation_prompt.format(message=message)},
+            {"role": "user", "content": moderation_prompt.format(rules=MODERATION_RULES, message=message)},
         ],
-        "temperature": 0.1,
-        "max_tokens": 50,
-    }
+        "moderation",
+        temperature=0.1,
+        max_tokens=50,
+    )
+    if error:
+        return (True, None), error
+
+    # Parse the response
+    parsed = extract_json_object(content)
+    if parsed and isinstance(parsed, dict):
+        if parsed.get("safe") == True:
+            return (True, None), None
+        else:
+            return (False, parsed.get("reason", "rule_violation")), None
+
+    # If we can't parse, assume safe (but don't let the guess be cached)
+    return (True, None), "Unable to parse moderation verdict."
+
+
+# Messages that reach the AI within MODERATION_BATCH_WINDOW_MS of each other
+# share one DeepSeek call: the first caller leads the batch, waits out the
+# window (or until it fills), asks for per-message verdicts and hands each
+# waiter its answer. Anything missing from the reply falls back to a single call.
+# Messages from different users share the prompt, so one of them can try to
+# talk the model into passing the rest: when a batch flags anything or drops an
+# id, its "safe" verdicts are re-checked one by one, and only verdicts from
+# single calls are ever cached.
+MODERATION_BATCH_WINDOW_MS = int(os.getenv("MODERATION_BATCH_WINDOW_MS", "30"))
+MODERATION_BATCH_MAX_SIZE = int(os.getenv("MODERATION_BATCH_MAX_SIZE", "20"))
+# Followers outwait the leader's worst case (window + slot wait + connect + read)
+# with a little slack, so a slow batch never triggers duplicate calls.
+MODERATION_BATCH_WAIT_SECONDS = (
+    MODERATION_BATCH_WINDOW_MS / 1000
+    + DEEPSEEK_SLOT_WAITS["moderation_batch"]
+    + sum(DEEPSEEK_TIMEOUTS["moderation_batch"])
+    + 2
+)
+MODERATION_BATCH = None
+MODERATION_BATCH_STATS = {"batches": 0, "messages": 0, "fallbacks": 0, "rechecks": 0}
+MODERATION_BATCH_LOCK = threading.Lock()
+
+
+def ai_moderation_batch_verdicts(messages, api_key):
+    """Moderate several messages in one call. Returns a list of verdicts (None where missing)."""
+
+    moderation_prompt = """You are a chat room moderator for a mental health support community. 
+Analyze each message below and determine if it violates ANY of these rules:
+
+{rules}
+
+Messages to check, as a JSON array of {{"id", "text"}} objects:
+{messages}
+
+Respond with ONLY a JSON array containing one object per message id, for example:
+[{{"id": 0, "safe": true}}, {{"id": 1, "safe": false, "reason": "contact_info"}}]
+Valid reasons are contact_info, meeting_request, sexual_content, offensive and harmful.
+
+Be strict. Even subtle attempts to bypass rules should be flagged."""
+
+    numbered = json.dumps([{"id": index, "text": text} for index, text in enumerate(messages)])
+    content, error = deepseek_completion(
+        api_key,
+        [
+            {"role": "system", "content": "You are a strict chat moderator. Respond only with JSON."},
+            {"role": "user", "content": moderation_prompt.format(rules=MODERATION_RULES, messages=numbered)},
+        ],
+        "moderation_batch",
+        temperature=0.1,
+        max_tokens=30 * len(messages) + 20,
+    )
+    verdicts = [None] * len(messages)
+    if error:
+        print(f"AI moderation batch error: {error}")
+        return verdicts
 
+    start, end = content.find("["), content.rfind("]")
     try:
-        request_data = json.dumps(payload).encode("utf-8")
-        request_headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        }
-        req = urlrequest.Request(
-            "https://api.deepseek.com/v1/chat/completions",
-            data=request_data,
-            headers=request_headers,
+        parsed = json.loads(content[start : end + 1]) if start != -1 and end > start else []
+    except json.JSONDecodeError:
+        parsed = []
+
+    for item in parsed if isinstance(parsed, list) else []:
+        index = item.get("id") if isinstance(item, dict) else None
+        if isinstance(index, int) and 0 <= index < len(messages) and isinstance(item.get("safe"), bool):
+            verdicts[index] = (True, None) if item["safe"] else (False, item.get("reason") or "rule_violation")
+    return verdicts
+
+
+def moderate_in_batch(message, api_key):
+    """Return ``(verdict, error, confirmed)``, sharing the call with concurrent messages.
+
+    ``confirmed`` is False for verdicts taken from a shared batch, which must not be cached.
+    """
+
+    global MODERATION_BATCH
+
+    with MODERATION_BATCH_LOCK:
+        batch = MODERATION_BATCH
+        is_leader = batch is None
+        if is_leader:
+            batch = MODERATION_BATCH = {
+                "messages": [],
+                "verdicts": None,
+                "full": threading.Event(),
+                "done": threading.Event(),
+            }
+        index = len(batch["messages"])
+        batch["messages"].append(message)
+        if len(batch["messages"]) >= MODERATION_BATCH_MAX_SIZE:
+            MODERATION_BATCH = None
+            batch["full"].set()
+
+    if is_leader:
+        batch["full"].wait(MODERATION_BATCH_WINDOW_MS / 1000)
+        with MODERATION_BATCH_LOCK:
+            if MODERATION_BATCH is batch:
+                MODERATION_BATCH = None
+        messages = batch["messages"]
+        try:
+            if len(messages) > 1:
+                batch["verdicts"] = ai_moderation_batch_verdicts(messages, api_key)
+                with MODERATION_BATCH_LOCK:
+                    MODERATION_BATCH_STATS["batches"] += 1
+                    MODERATION_BATCH_STATS["messages"] += len(messages)
+        finally:
+            batch["done"].set()
+    else:
+        batch["done"].wait(MODERATION_BATCH_WAIT_SECONDS)
+
+    verdicts = batch["verdicts"] or [None] * (index + 1)
+    verdict = verdicts[index]
+    suspect = any(other is None or not other[0] for other in verdicts)
+    if verdict and not (verdict[0] and suspect):
+        return verdict, None, False
+
+    if len(batch["messages"]) > 1:
+        with MODERATION_BATCH_LOCK:
+            MODERATION_BATCH_STATS["rechecks" if verdict else "fallbacks"] += 1
+    verdict, error = ai_moderation_verdict(message, api_key)
+    return verdict, error, True
+
+
+def moderation_batch_summary():
+    with MODERATION_BATCH_LOCK:
+        stats = dict(MODERATION_BATCH_STATS)
+    stats["avg_batch_size"] = round(stats["messages"] / stats["batches"], 1) if stats["batches"] else None
+    stats["window_ms"] = MODERATION_BATCH_WINDOW_MS
+    return stats
+
+
+# AI verdicts are cached by normalised message text under the current
+# blocked-words/rules version: an LRU in memory, backed by the local database so
+# the common "hi"/"lol"/"same" verdicts survive restarts.
+MODERATION_PROMPT_VERSION = "1"
+MODERATION_CACHE_SIZE = int(os.getenv("MODERATION_CACHE_SIZE", "5000"))
+MODERATION_CACHE_TTL_SECONDS = int(os.getenv("MODERATION_CACHE_TTL_SECONDS", str(7 * 86400)))
+MODERATION_CACHE = OrderedDict()
+MODERATION_CACHE_READY = False
+MODERATION_CACHE_STATS = {"hits": 0, "disk_hits": 0, "misses": 0}
+MODERATION_CACHE_LOCK = threading.Lock()
+
+
+def ensure_moderation_cache_schema():
+    global MODERATION_CACHE_READY
+    if MODERATION_CACHE_READY:
+        return
+
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS moderation_verdicts (
+                cache_key TEXT PRIMARY KEY,
+                is_safe INTEGER NOT NULL,
+                reason TEXT,
+                expires_at REAL NOT NULL
+            );
+            """
         )
-        with urlrequest.urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode("utf-8"))
-        
-        content = (result.get("choices") or [{}])[0].get("message", {}).get("content", "")
-        
-        # Parse the response
-        parsed = extract_json_object(content)
-        if parsed and isinstance(parsed, dict):
-            if parsed.get("safe") == True:
-                return True, None
-            else:
-                return False, parsed.get("reason", "rule_violation")
-        
-        # If we can't parse, assume safe
-        return True, None
-        
-    except Exception as e:
-        print(f"AI moderation error: {e}")
-        # On error, fall back to basic check only
-        return True, None
+        connection.execute("DELETE FROM moderation_verdicts WHERE expires_at <= ?", [time.time()])
+    MODERATION_CACHE_READY = True
+
+
+def moderation_rules_version(settings):
+    source = "\n".join(
+        [
+            MODERATION_PROMPT_VERSION,
+            settings.get(CHAT_BLOCKED_WORDS_KEY, ""),
+            settings.get(CHAT_RULES_KEY, ""),
+        ]
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def moderation_cache_key(message, rules_version):
+    normalized = " ".join(message.lower().split())
+    return f"{rules_version}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+
+def find_moderation_verdict(cache_key):
+    now = time.time()
+    with MODERATION_CACHE_LOCK:
+        entry = MODERATION_CACHE.get(cache_key)
+        if entry and entry[1] > now:
+            MODERATION_CACHE.move_to_end(cache_key)
+            MODERATION_CACHE_STATS["hits"] += 1
+            return entry[0]
+
+    ensure_moderation_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT is_safe, reason, expires_at FROM moderation_verdicts WHERE cache_key = ? AND expires_at > ?",
+            [cache_key, now],
+        ).fetchone()
+
+    with MODERATION_CACHE_LOCK:
+        if not row:
+            MODERATION_CACHE.pop(cache_key, None)
+            MODERATION_CACHE_STATS["misses"] += 1
+            return None
+        verdict = (bool(row[0]), row[1])
+        cache_moderation_verdict(cache_key, verdict, row[2])
+        MODERATION_CACHE_STATS["disk_hits"] += 1
+    return verdict
+
+
+def cache_moderation_verdict(cache_key, verdict, expires_at):
+    """Insert into the in-memory LRU; callers hold MODERATION_CACHE_LOCK."""
+
+    MODERATION_CACHE[cache_key] = (verdict, expires_at)
+    MODERATION_CACHE.move_to_end(cache_key)
+    while len(MODERATION_CACHE) > MODERATION_CACHE_SIZE:
+        MODERATION_CACHE.popitem(last=False)
+
+
+def remember_moderation_verdict(cache_key, verdict):
+    expires_at = time.time() + MODERATION_CACHE_TTL_SECONDS
+    with MODERATION_CACHE_LOCK:
+        cache_moderation_verdict(cache_key, verdict, expires_at)
+
+    ensure_moderation_cache_schema()
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            INSERT INTO moderation_verdicts (cache_key, is_safe, reason, expires_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                is_safe = excluded.is_safe, reason = excluded.reason, expires_at = excluded.expires_at
+            """,
+            [cache_key, 1 if verdict[0] else 0, verdict[1], expires_at],
+        )
+
+
+def moderation_cache_summary():
+    with MODERATION_CACHE_LOCK:
+        stats = dict(MODERATION_CACHE_STATS)
+        entries = len(MODERATION_CACHE)
+    lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+    return {
+        **stats,
+        "hit_rate": round((stats["hits"] + stats["disk_hits"]) / lookups, 3) if lookups else None,
+        "entries": entries,
+        "max_entries": MODERATION_CACHE_SIZE,
+        "ttl_seconds": MODERATION_CACHE_TTL_SECONDS,
+    }
+
+
+# Clear-cut messages are decided locally before any AI call: contact details
+# (including spaced-out or spelled-out variants) are blocked, and short everyday
+# replies are allowed. Anything else is escalated to the AI moderator.
+MODERATION_DIGIT_WORD = r"(?:\d|zero|oh|one|two|three|four|five|six|seven|eight|nine)"
+MODERATION_SOCIAL_PLATFORM = (
+    r"(?:insta(?:gram)?|ig|snap(?:chat)?|sc|whats\s*app|telegram|discord|tik\s*tok|kik|twitter|facebook|fb)"
+)
+MODERATION_HANDLE = r"(?:@[\w.]{2,}|[a-z][\w.]*[\d_][\w.]*)"
+MODERATION_CONTACT_PATTERNS = (
+    # Emails, plain or with the dot spelled out: "jo@mail.com", "jo (at) mail dot com".
+    # A spelled-out address only counts when its domain ends the message.
+    re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"),
+    re.compile(
+        r"\b[\w.+-]+\s*(?:@|\s+at\s+|[\[(]\s*at\s*[\])])\s*[\w-]+"
+        r"(?:\s+dot\s+|\s*[\[(]\s*dot\s*[\])]\s*)(?:com|net|org|co|uk|io|me)[\s.!?]*$"
+    ),
+    # Phone numbers: UK mobiles/landlines, international and US-style groupings,
+    # digits spaced out one by one, or spelled out. Other digit runs (dates,
+    # counts) are left for the AI.
+    re.compile(r"(?<![\d.-])(?:\+\s*44\s*\(?0?\)?\s*|0)7\d{3}[\s.-]?\d{3}[\s.-]?\d{3}(?![\d.-]*\d)"),
+    re.compile(r"(?<![\d.-])0\d{2,4}[\s-]?\d{3,4}[\s-]?\d{3,4}(?![\d.-]*\d)"),
+    re.compile(r"\+\s*\d{1,3}(?:[\s.-]?\(?\d{2,5}\)?){2,5}(?![\d.-]*\d)"),
+    re.compile(r"(?<![\d.-])\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}(?![\d.-]*\d)"),
+    re.compile(r"\b\d(?:[\s.,-]+\d\b){6,}"),
+    re.compile(rf"\b{MODERATION_DIGIT_WORD}(?:[\s,.-]+{MODERATION_DIGIT_WORD}\b){{6,}}"),
+    # Social handles: "add me on insta", "my snap is bob_22", "ig: @name"
+    re.compile(rf"\b(?:add|follow|dm|message|text|hmu|hit)\s+me\b.{{0,20}}\b{MODERATION_SOCIAL_PLATFORM}\b"),
+    re.compile(rf"\bmy\s+{MODERATION_SOCIAL_PLATFORM}\b(?:\s+is\s+|\s*[:=]\s*|\s+){MODERATION_HANDLE}"),
+    re.compile(rf"\bmy\s+{MODERATION_SOCIAL_PLATFORM}\s+(?:handle|username|user\s*name|id)\s*(?:is|:|=)\s*@?[\w.]{{2,}}"),
+    re.compile(rf"\b{MODERATION_SOCIAL_PLATFORM}\b(?:\s+is\s+|\s*[:-]\s*|\s*)@[\w.]{{2,}}"),
+)
+MODERATION_ALLOWED_MESSAGES = frozenset(
+    {
+        "hi", "hey", "hello", "hiya", "yo", "sup", "morning", "good morning", "good night", "gn", "gm",
+        "bye", "cya", "see you", "lol", "lmao", "haha", "hahaha", "omg", "aw", "aww", "same", "me too",
+        "ok", "okay", "k", "kk", "sure", "yes", "yeah", "yep", "yup", "no", "nope", "nah", "true",
+        "agreed", "exactly", "fair", "nice", "cool", "thanks", "thank you", "thx", "ty", "welcome",
+        "you're welcome", "hugs", "sending hugs", "i agree", "how are you", "how are you doing",
+        "im ok", "i'm ok", "im good", "i'm good", "not bad", "same here", "that helps", "love that",
+    }
+)
+MODERATION_LOCAL_STATS = {"allowed": 0, "blocked": 0, "escalated": 0}
+
+
+def classify_message_locally(message):
+    """Return a verdict for clear-cut messages, or None to escalate to the AI."""
+
+    lowered = message.lower()
+    verdict = None
+    if any(pattern.search(lowered) for pattern in MODERATION_CONTACT_PATTERNS):
+        verdict = (False, "contact_info")
+    elif re.sub(r"[^\w\s']+", "", " ".join(lowered.split())).strip() in MODERATION_ALLOWED_MESSAGES:
+        verdict = (True, None)
+
+    outcome = "escalated" if verdict is None else ("allowed" if verdict[0] else "blocked")
+    with MODERATION_CACHE_LOCK:
+        MODERATION_LOCAL_STATS[outcome] += 1
+    return verdict
+
+
+def moderation_local_summary():
+    with MODERATION_CACHE_LOCK:
+        return dict(MODERATION_LOCAL_STATS)
 
 
 def check_message_content(message):
@@ -1243,15 +2534,31 @@ def check_message_content(message):
     is_safe, reason = check_message_content_basic(message)
     if not is_safe:
         return False, reason
-    
+
+    local_verdict = classify_message_locally(message)
+    if local_verdict:
+        return local_verdict
+
     # Then do AI check if API key is available
-    api_key = get_deepseek_api_key().strip()
-    if api_key:
-        is_safe, reason = ai_moderate_message(message, api_key)
-        if not is_safe:
-            return False, reason
-    
-    return True, None
+    settings = load_site_settings()
+    api_key = settings.get(DEEPSEEK_SETTING_KEY, "").strip()
+    if not api_key:
+        return True, None
+
+    cache_key = moderation_cache_key(message, moderation_rules_version(settings))
+    cached = find_moderation_verdict(cache_key)
+    if cached:
+        return cached
+
+    verdict, error, confirmed = moderate_in_batch(message, api_key)
+    if error:
+        print(f"AI moderation error: {error}")
+        # On error, fall back to basic check only
+        return True, None
+
+    if confirmed:
+        remember_moderation_verdict(cache_key, verdict)
+    return verdict
 
 
 def extract_json_object(text):
@@ -1293,41 +2600,17 @@ def deepseek_charity_lookup(api_key, charity):
         f"Description: {charity.get('description', '')}"
     )
 
-    payload = {
-        "model": "deepseek-chat",
-        "messages": [
+    content, error = deepseek_completion(
+        api_key,
+        [
             {"role": "system", "content": "You return only helpful JSON without commentary."},
             {"role": "user", "content": f"{prompt}\n\n{charity_summary}"},
         ],
-        "temperature": 0.2,
-    }
-
-    request_data = json.dumps(payload).encode("utf-8")
-    request_headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
-
-    try:
-        req = urlrequest.Request(
-            "https://api.deepseek.com/chat/completions",
-            data=request_data,
-            headers=request_headers,
-        )
-        with urlrequest.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:  # pragma: no cover - external dependency
-        return None, f"DeepSeek request failed: {exc.reason or exc.code}"
-    except URLError as exc:  # pragma: no cover - external dependency
-        return None, f"DeepSeek request failed: {getattr(exc, 'reason', exc)}"
-    except Exception as exc:  # pragma: no cover - network variability
-        return None, f"DeepSeek lookup error: {exc}"
-
-    content = (
-        (result.get("choices") or [{}])[0]
-        .get("message", {})
-        .get("content", "")
+        "charity_lookup",
+        temperature=0.2,
     )
+    if error:
+        return None, error
 
     data = extract_json_object(content)
     if not isinstance(data, dict):
@@ -1364,37 +2647,18 @@ def deepseek_useful_contact_lookup(api_key, topic, forbidden_names=None):
         f"{avoidance}"
     )
 
-    payload = {
-        "model": "deepseek-chat",
-        "messages": [
+    content, error = deepseek_completion(
+        api_key,
+        [
             {"role": "system", "content": "Respond with a single JSON object and no commentary."},
             {"role": "user", "content": prompt},
         ],
-        "temperature": 0.2,
-    }
-
-    request_data = json.dumps(payload).encode("utf-8")
-    request_headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
-
-    try:
-        req = urlrequest.Request(
-            "https://api.deepseek.com/chat/completions",
-            data=request_data,
-            headers=request_headers,
-        )
-        with urlrequest.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:  # pragma: no cover - external dependency
-        return None, f"DeepSeek request failed: {exc.code}"
-    except URLError:  # pragma: no cover - external dependency
-        return None, "Unable to reach DeepSeek API."
-    except TimeoutError:  # pragma: no cover - external dependency
-        return None, "DeepSeek request timed out."
+        "contact_lookup",
+        temperature=0.2,
+    )
+    if error:
+        return None, error
 
-    content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
     data = extract_json_object(content)
 
     if not isinstance(data, dict):
@@ -1415,16 +2679,74 @@ def mask_secret(value):
         return value
     return f"{value[:4]}…{value[-4:]}"
 
+BOOKS_WITH_VIEWS_SELECT = """
+SELECT
+    books.id,
+    books.title,
+    books.author,
+    books.description,
+    books.affiliate_url,
+    books.cover_url,
+    books.slug,
+    COALESCE(book_views.count, 0) AS view_count
+FROM books
+LEFT JOIN book_views ON book_views.slug = books.slug
+"""
+BOOKS_WITH_VIEWS_SQL = BOOKS_WITH_VIEWS_SELECT + "ORDER BY books.id"
+BOOKS_PAGE_SQL = BOOKS_WITH_VIEWS_SELECT + "WHERE books.id > ?\nORDER BY books.id\nLIMIT ?"
+BOOKS_PAGE_SIZE = 24
+BOOKS_PAGE_MAX_SIZE = 100
+BOOK_API_FIELDS = [
+    "id",
+    "slug",
+    "title",
+    "author",
+    "description",
+    "affiliate_url",
+    "cover_url",
+    "cover_src",
+    "cover_srcset",
+    "view_count",
+    "is_most_viewed",
+]
+
+
+# The unique dedupe_key index is the source of truth for duplicate books; a
+# repeat insert only fills in a cover the existing row is missing.
+UPSERT_BOOK_INSERT_SQL = (
+    "INSERT INTO books (title, author, description, affiliate_url, cover_url, slug, dedupe_key)\nVALUES "
+)
+UPSERT_BOOK_ROW_SQL = "(?, ?, ?, ?, ?, ?, ?)"
+UPSERT_BOOK_CONFLICT_SQL = """
+ON CONFLICT(dedupe_key) DO UPDATE SET
+    cover_url = CASE
+        WHEN COALESCE(books.cover_url, '') = '' THEN excluded.cover_url
+        ELSE books.cover_url
+    END
+"""
+UPSERT_BOOK_SQL = UPSERT_BOOK_INSERT_SQL + UPSERT_BOOK_ROW_SQL + UPSERT_BOOK_CONFLICT_SQL
+# D1 allows at most 100 bound parameters per query, so multi-row upserts are chunked.
+D1_MAX_BOUND_PARAMS = 100
+BULK_IMPORT_WORKERS = int(os.getenv("BULK_IMPORT_WORKERS", "4"))
+
+
+def book_from_row(row):
+    return {
+        "id": row.get("id") if isinstance(row, dict) else None,
+        "title": row.get("title", ""),
+        "author": row.get("author", ""),
+        "description": row.get("description", ""),
+        "affiliate_url": row.get("affiliate_url", ""),
+        "cover_url": row.get("cover_url", ""),
+        "slug": row.get("slug") or "",
+        "view_count": int(row.get("view_count") or 0),
+    }
+
+
 def load_books():
     ensure_tables()
 
-    rows = d1_query(
-        """
-        SELECT id, title, author, description, affiliate_url, cover_url
-        FROM books
-        ORDER BY id
-        """
-    )
+    rows = d1_query(BOOKS_WITH_VIEWS_SQL)
 
     if not rows:
         books_from_disk = load_books_file()
@@ -1433,34 +2755,54 @@ def load_books():
 
         if books_from_disk:
             save_books(books_from_disk)
-            rows = d1_query(
-                """
-                SELECT id, title, author, description, affiliate_url, cover_url
-                FROM books
-                ORDER BY id
-                """
-            )
+            rows = d1_query(BOOKS_WITH_VIEWS_SQL)
         else:
             return []
 
-    books = [
-        {
-            "id": row.get("id") if isinstance(row, dict) else None,
-            "title": row.get("title", ""),
-            "author": row.get("author", ""),
-            "description": row.get("description", ""),
-            "affiliate_url": row.get("affiliate_url", ""),
-            "cover_url": row.get("cover_url", ""),
-        }
-        for row in rows
-    ]
+    return [book_from_row(row) for row in rows]
 
-    deduped_books = deduplicate_books(books)
-    if len(deduped_books) != len(books):
-        save_books(deduped_books)
-        return deduped_books
 
-    return deduped_books
+def load_books_page(after_id=None, limit=BOOKS_PAGE_SIZE):
+    """Return one page of books after ``after_id`` plus the cursor for the next page."""
+
+    ensure_tables()
+
+    rows = d1_query(BOOKS_PAGE_SQL, [after_id or 0, limit + 1])
+    if not rows and not after_id:
+        # An empty catalogue is seeded from disk or defaults on first read.
+        load_books()
+        rows = d1_query(BOOKS_PAGE_SQL, [0, limit + 1])
+
+    page = [book_from_row(row) for row in rows[:limit]]
+    next_cursor = page[-1]["id"] if len(rows) > limit and page else None
+    return page, next_cursor
+
+
+def most_viewed_book_slug():
+    rows = d1_query(
+        """
+        SELECT books.slug, book_views.count
+        FROM books
+        JOIN book_views ON book_views.slug = books.slug
+        WHERE book_views.count > 0
+        ORDER BY book_views.count DESC
+        LIMIT 2
+        """
+    )
+
+    if len(rows) == 1 or (len(rows) == 2 and rows[0].get("count") != rows[1].get("count")):
+        return rows[0].get("slug")
+    return None
+
+
+def book_record(book):
+    return {
+        "title": book.get("title", ""),
+        "author": book.get("author", ""),
+        "description": book.get("description", ""),
+        "affiliate_url": book.get("affiliate_url", ""),
+        "cover_url": book.get("cover_url", ""),
+    }
 
 
 def deduplicate_books(books):
@@ -1468,11 +2810,7 @@ def deduplicate_books(books):
     seen = {}
 
     for book in books:
-        key = (
-            book.get("title", "").strip().lower(),
-            book.get("author", "").strip().lower(),
-            book.get("affiliate_url", "").strip().lower(),
-        )
+        key = book_dedupe_key(book)
 
         if key in seen:
             existing = seen[key]
@@ -1480,33 +2818,13 @@ def deduplicate_books(books):
                 existing["cover_url"] = book.get("cover_url")
             continue
 
-        clean_book = {
-            "title": book.get("title", ""),
-            "author": book.get("author", ""),
-            "description": book.get("description", ""),
-            "affiliate_url": book.get("affiliate_url", ""),
-            "cover_url": book.get("cover_url", ""),
-        }
+        clean_book = book_record(book)
         seen[key] = clean_book
         deduped.append(clean_book)
 
     return deduped
 
 
-def load_book_view_counts():
-    ensure_tables()
-
-    rows = d1_query("SELECT slug, count FROM book_views")
-    counts = {row.get("slug"): row.get("count", 0) for row in rows if row.get("slug")}
-
-    if counts:
-        return counts
-
-    with open_local_db(sqlite3.Row) as connection:
-        cursor = connection.execute("SELECT slug, count FROM book_views")
-        return {row["slug"]: row["count"] for row in cursor.fetchall()}
-
-
 def increment_book_view(slug):
     if not slug:
         return
@@ -1527,28 +2845,301 @@ def save_books(books):
     ensure_tables()
     books = deduplicate_books(books)
 
-    ensure_local_data_dir()
-    with LOCAL_BOOKS_FILE.open("w") as f:
-        json.dump(books, f, indent=2)
+    write_books_snapshot(books)
 
     d1_query("DELETE FROM books")
 
-    for book in books:
+    for book in assign_book_slugs([dict(book) for book in books]):
         d1_query(
-            """
-            INSERT INTO books (title, author, description, affiliate_url, cover_url)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            UPSERT_BOOK_SQL,
             [
                 book.get("title", ""),
                 book.get("author", ""),
                 book.get("description", ""),
                 book.get("affiliate_url", ""),
                 book.get("cover_url", ""),
+                book["slug"],
+                book_dedupe_key(book),
             ],
         )
 
 
+def pick_free_slug(base, taken):
+    slug = base
+    suffix = 2
+    while slug in taken:
+        slug = f"{base}-{suffix}"
+        suffix += 1
+    return slug
+
+
+def next_free_book_slug(book, exclude_id=None):
+    base = book_slug(book)
+    rows = d1_query("SELECT id, slug FROM books WHERE slug = ? OR slug LIKE ?", [base, f"{base}-%"])
+    taken = {row.get("slug") for row in rows if row.get("id") != exclude_id}
+    return pick_free_slug(base, taken)
+
+
+def insert_book(book):
+    ensure_tables()
+    record = book_record(book)
+
+    d1_query(
+        UPSERT_BOOK_SQL,
+        [
+            record["title"],
+            record["author"],
+            record["description"],
+            record["affiliate_url"],
+            record["cover_url"],
+            next_free_book_slug(record),
+            book_dedupe_key(record),
+        ],
+    )
+    append_books_log({"op": "upsert", "book": record})
+    prefetch_covers([record])
+
+
+def update_book_record(existing, book):
+    ensure_tables()
+    record = book_record(book)
+    dedupe_key = book_dedupe_key(record)
+    book_id = existing.get("id")
+
+    conflict = d1_query(
+        "SELECT id FROM books WHERE dedupe_key = ? AND id != ?",
+        [dedupe_key, book_id],
+    )
+    if conflict:
+        return False, "Another book already uses that title, author, and link."
+
+    slug = existing.get("slug")
+    if not slug or book_slug(existing) != book_slug(record):
+        slug = next_free_book_slug(record, exclude_id=book_id)
+
+    d1_query(
+        """
+        UPDATE books
+        SET title = ?, author = ?, description = ?, affiliate_url = ?, cover_url = ?, slug = ?, dedupe_key = ?
+        WHERE id = ?
+        """,
+        [
+            record["title"],
+            record["author"],
+            record["description"],
+            record["affiliate_url"],
+            record["cover_url"],
+            slug,
+            dedupe_key,
+            book_id,
+        ],
+    )
+    append_books_log({"op": "update", "key": book_dedupe_key(existing), "book": record})
+    prefetch_covers([record])
+    return True, None
+
+
+def delete_book_record(book):
+    ensure_tables()
+    d1_query("DELETE FROM books WHERE id = ?", [book.get("id")])
+    append_books_log({"op": "delete", "key": book_dedupe_key(book)})
+
+
+def insert_books(books):
+    """Upsert many books with multi-row statements, one log append and one prefetch."""
+
+    ensure_tables()
+    records = [book_record(book) for book in books]
+    if not records:
+        return []
+
+    taken = {row.get("slug") for row in d1_query("SELECT slug FROM books")}
+    rows = []
+    for record in records:
+        slug = pick_free_slug(book_slug(record), taken)
+        taken.add(slug)
+        rows.append(
+            [
+                record["title"],
+                record["author"],
+                record["description"],
+                record["affiliate_url"],
+                record["cover_url"],
+                slug,
+                book_dedupe_key(record),
+            ]
+        )
+
+    rows_per_query = D1_MAX_BOUND_PARAMS // len(rows[0])
+    for start in range(0, len(rows), rows_per_query):
+        chunk = rows[start : start + rows_per_query]
+        d1_query(
+            UPSERT_BOOK_INSERT_SQL + ",\n".join([UPSERT_BOOK_ROW_SQL] * len(chunk)) + UPSERT_BOOK_CONFLICT_SQL,
+            [value for row in chunk for value in row],
+        )
+
+    append_books_log(*({"op": "upsert", "book": record} for record in records))
+    prefetch_covers(records)
+    return records
+
+
+def parse_import_urls(text):
+    """Pull book URLs from a CSV (a url column, or the first link per row) or a newline list."""
+
+    import csv
+
+    lines = [line.strip() for line in (text or "").splitlines() if line.strip()]
+    if not lines:
+        return []
+
+    header = [cell.strip().lower() for cell in next(csv.reader([lines[0]], skipinitialspace=True))]
+    url_column = next(
+        (header.index(name) for name in ("url", "book_url", "affiliate_url", "link") if name in header),
+        None,
+    )
+
+    urls = []
+    for line in lines[1:] if url_column is not None else lines:
+        # A bare URL line may itself contain commas, so don't split it as CSV.
+        if url_column is None and line.startswith(("http://", "https://")) and len(line.split()) == 1:
+            urls.append(line)
+            continue
+
+        cells = next(csv.reader([line], skipinitialspace=True))
+        if url_column is not None:
+            cells = cells[url_column : url_column + 1]
+        url = next((cell.strip() for cell in cells if cell.strip().startswith(("http://", "https://"))), None)
+        if url:
+            urls.append(url)
+
+    return list(dict.fromkeys(normalize_url(url) for url in urls))
+
+
+def bulk_import_books(urls, workers=None, force_refresh=False):
+    """Scrape URLs concurrently and add every new book in one batched write.
+
+    Returns one ``{"url", "status", "message"}`` entry per URL, where status
+    is ``added``, ``duplicate`` or ``failed``. Per-host request limits come
+    from ``http_request`` and the Chrome driver pool.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    existing = load_books()
+    existing_urls = {normalize_url(book.get("affiliate_url", "")) for book in existing}
+    existing_keys = {book_dedupe_key(book) for book in existing}
+
+    report = {}
+    to_scrape = []
+    for url in urls:
+        if url in existing_urls:
+            report[url] = {"url": url, "status": "duplicate", "message": "Already in the catalogue."}
+        else:
+            to_scrape.append(url)
+
+    def scrape(url):
+        try:
+            return scrape_book_metadata(url, force_refresh=force_refresh)
+        except Exception as exc:
+            return None, f"Error while scraping book details: {exc}"
+
+    with ThreadPoolExecutor(max_workers=workers or BULK_IMPORT_WORKERS) as executor:
+        results = list(executor.map(scrape, to_scrape))
+
+    new_books = {}
+    for url, (book, error) in zip(to_scrape, results):
+        if error:
+            report[url] = {"url": url, "status": "failed", "message": error}
+            continue
+        key = book_dedupe_key(book)
+        if key in existing_keys:
+            report[url] = {"url": url, "status": "duplicate", "message": f"{book['title']} is already listed."}
+            continue
+        existing_keys.add(key)
+        new_books[url] = book
+        report[url] = {"url": url, "status": "added", "message": book["title"]}
+
+    try:
+        insert_books(new_books.values())
+    except Exception as exc:
+        for url in new_books:
+            report[url] = {"url": url, "status": "failed", "message": f"Could not save book: {exc}"}
+
+    return [report[url] for url in urls]
+
+
+def import_report_summary(report):
+    counts = {"added": 0, "duplicate": 0, "failed": 0}
+    for entry in report:
+        counts[entry["status"]] += 1
+    return f"Imported {counts['added']} books ({counts['duplicate']} duplicates, {counts['failed']} failed)."
+
+
+def enqueue_import_job(urls, force_refresh=False):
+    """Queue a bulk import on the scrape job executor; the report is stored when it finishes."""
+
+    executor = scrape_job_executor()
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            INSERT INTO import_jobs (id, urls_json, status, force_refresh, created_at, updated_at)
+            VALUES (?, ?, 'queued', ?, ?, ?)
+            """,
+            [job_id, json.dumps(urls), int(force_refresh), now, now],
+        )
+    executor.submit(run_import_job, job_id)
+    return job_id
+
+
+def update_import_job(job_id, status, message=None, report=None):
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            UPDATE import_jobs
+            SET status = ?, message = ?, report_json = COALESCE(?, report_json), updated_at = ?
+            WHERE id = ?
+            """,
+            [status, message, json.dumps(report) if report is not None else None, time.time(), job_id],
+        )
+
+
+def load_import_job(job_id):
+    scrape_job_executor()
+    with open_local_db(sqlite3.Row) as connection:
+        row = connection.execute(
+            """
+            SELECT id, urls_json, status, message, report_json, force_refresh, created_at, updated_at
+            FROM import_jobs WHERE id = ?
+            """,
+            [job_id],
+        ).fetchone()
+    if not row:
+        return None
+
+    job = dict(row)
+    job["urls"] = json.loads(job.pop("urls_json"))
+    job["report"] = json.loads(job.pop("report_json") or "[]")
+    job["total"] = len(job["urls"])
+    return job
+
+
+def run_import_job(job_id):
+    job = load_import_job(job_id)
+    if not job or job["status"] in {"done", "failed"}:
+        return
+
+    update_import_job(job_id, "running", f"Importing {job['total']} book URLs.")
+    try:
+        report = bulk_import_books(job["urls"], force_refresh=bool(job["force_refresh"]))
+    except Exception as exc:
+        update_import_job(job_id, "failed", f"Bulk import failed: {exc}")
+        return
+
+    update_import_job(job_id, "done", import_report_summary(report), report)
+
+
 def load_charities():
     ensure_tables()
 
@@ -1871,32 +3462,51 @@ def pick_featured_books(books, count=3):
     return list(range(count))
 
 
-def books_with_indices(books, view_counts=None):
-    view_counts = view_counts or load_book_view_counts()
-    max_views = max(view_counts.values(), default=0)
-    max_viewed_slug = None
+def cover_proxy_url(book, width=None):
+    return url_for(
+        "cover_proxy",
+        url=book.get("cover_url") or "",
+        title=book.get("title", ""),
+        author=book.get("author", ""),
+        w=width,
+    )
+
+
+def cover_proxy_srcset(book):
+    return ", ".join(f"{cover_proxy_url(book, width)} {width}w" for width in COVER_VARIANT_WIDTHS)
 
-    if max_views > 0:
-        leaders = [slug for slug, count in view_counts.items() if count == max_views]
-        if len(leaders) == 1:
-            max_viewed_slug = leaders[0]
 
+def books_page_with_data(books, most_viewed_slug=None, start_index=0):
     books_with_data = []
-    for idx, book in enumerate(books):
+    for offset, book in enumerate(books):
+        idx = start_index + offset
         slug = book.get("slug") or book_slug(book, f"book-{idx}")
-        view_count = view_counts.get(slug, 0)
         books_with_data.append(
             {
                 **book,
                 "index": idx,
                 "slug": slug,
-                "view_count": view_count,
-                "is_most_viewed": slug == max_viewed_slug,
+                "view_count": book.get("view_count", 0),
+                "cover_src": cover_proxy_url(book),
+                "cover_srcset": cover_proxy_srcset(book),
+                "is_most_viewed": bool(most_viewed_slug) and slug == most_viewed_slug,
             }
         )
 
     return books_with_data
 
+
+def books_with_indices(books):
+    max_views = max((book.get("view_count", 0) for book in books), default=0)
+    max_viewed_slug = None
+
+    if max_views > 0:
+        leaders = [book.get("slug") for book in books if book.get("view_count", 0) == max_views]
+        if len(leaders) == 1:
+            max_viewed_slug = leaders[0]
+
+    return books_page_with_data(books, max_viewed_slug)
+
 RESOURCES = [
     {
         "title": "Crisis Support Lines",
@@ -2193,184 +3803,882 @@ def save_calming_counts(counts):
         )
 
 
-def calming_tools_with_counts():
-    counts = load_calming_counts()
-    updated = {}
-    tools_with_counts = []
+def calming_tools_with_counts():
+    counts = load_calming_counts()
+    updated = {}
+    tools_with_counts = []
+
+    for tool in CALMING_TOOLS:
+        slug = tool.get("slug", slugify(tool["title"]))
+        count = counts.get(slug, {"completed": 0, "views": 0})
+        updated[slug] = count
+        tools_with_counts.append(
+            {
+                **tool,
+                "slug": slug,
+                "completed_count": count.get("completed", 0),
+                "view_count": count.get("views", 0),
+            }
+        )
+
+    if counts.keys() != updated.keys():
+        save_calming_counts(updated)
+
+    return tools_with_counts
+
+
+def calming_tool_cards():
+    counts = load_calming_counts()
+    cards = []
+
+    for page in CALMING_TOOL_PAGES:
+        count_slug = page.get("count_slug") or page["slug"]
+        count = counts.get(count_slug, {"completed": 0, "views": 0})
+        cards.append(
+            {
+                **page,
+                "completed_count": count.get("completed", 0),
+                "view_count": count.get("views", 0),
+            }
+        )
+
+    return cards
+
+
+def find_calming_tool(slug):
+    for tool in CALMING_TOOLS:
+        if tool.get("slug") == slug:
+            return tool
+    return None
+
+COMMUNITY_HIGHLIGHTS = [
+    {
+        "title": "Peer Circles",
+        "description": "Weekly online spaces where you can share, listen, or simply sit with others who understand.",
+    },
+    {
+        "title": "Story Spotlights",
+        "description": "Gentle, anonymous stories from people who found support and kept going—proof that healing is possible.",
+    },
+    {
+        "title": "Resource Swaps",
+        "description": "A living list where the community adds podcasts, books, and practices that help them feel grounded.",
+    },
+]
+
+
+@app.route("/")
+def index():
+    books = books_with_indices(load_books())
+    charities = load_charities()
+    did_you_know_items = load_did_you_know_items()
+    return render_template(
+        "home.html",
+        resources=RESOURCES,
+        books=books,
+        charities=charities,
+        did_you_know_items=did_you_know_items,
+    )
+
+
+@app.route("/books")
+def books():
+    page, next_cursor = load_books_page()
+    book_list = books_page_with_data(page, most_viewed_book_slug())
+    return render_template("books.html", books=book_list, next_cursor=next_cursor)
+
+
+@app.route("/api/books")
+def books_api():
+    """Paginated catalogue for infinite scroll, keyed by the last book id seen."""
+
+    cursor = request.args.get("cursor", "").strip()
+    if cursor and not cursor.isdigit():
+        return {"error": "Invalid cursor."}, 400
+
+    limit = request.args.get("limit", type=int) or BOOKS_PAGE_SIZE
+    limit = max(1, min(limit, BOOKS_PAGE_MAX_SIZE))
+
+    fields = [field.strip() for field in request.args.get("fields", "").split(",") if field.strip()]
+    fields = fields or BOOK_API_FIELDS
+    unknown_fields = [field for field in fields if field not in BOOK_API_FIELDS]
+    if unknown_fields:
+        return {"error": f"Unknown fields: {', '.join(unknown_fields)}"}, 400
+
+    page, next_cursor = load_books_page(int(cursor) if cursor else None, limit)
+    most_viewed_slug = most_viewed_book_slug() if "is_most_viewed" in fields else None
+    books = [
+        {field: book.get(field) for field in fields}
+        for book in books_page_with_data(page, most_viewed_slug)
+    ]
+
+    response = jsonify(
+        {"books": books, "next_cursor": str(next_cursor) if next_cursor else None}
+    )
+    response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
+
+
+COVERS_CACHE_DIR = BASE_DIR / "static" / "covers_cache"
+COVER_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36",
+    "Referer": "https://www.google.com/",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+}
+COVERS_CACHE_MAX_BYTES = int(os.getenv("COVERS_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+# Evict down to this fraction of the quota so we are not evicting on every miss.
+COVERS_CACHE_LOW_WATERMARK = 0.9
+# Only rewrite last_access when it is older than this, keeping hits mostly read-only.
+COVER_ACCESS_RESOLUTION_SECONDS = 60
+COVER_CACHE_SCHEMA_READY = False
+COVER_CACHE_STATS = {
+    "hits": 0,
+    "misses": 0,
+    "negative_hits": 0,
+    "coalesced": 0,
+    "evictions": 0,
+    "evicted_bytes": 0,
+}
+COVER_CACHE_STATS_LOCK = threading.Lock()
+# In-flight cover fetches keyed by lookup key, so concurrent misses share one download.
+COVER_FLIGHTS = {}
+COVER_FLIGHTS_LOCK = threading.Lock()
+COVER_FLIGHT_WAIT_SECONDS = 45
+# Unresolvable covers are re-checked after 15 minutes, doubling per failure up to a week.
+COVER_MISS_RETRY_SECONDS = 15 * 60
+COVER_MISS_MAX_RETRY_SECONDS = 7 * 86400
+COVER_PLACEHOLDER_MAX_AGE = 3600
+# Fingerprinted /covers/<sha256>.<ext> URLs never change, so they can be cached for a year.
+# The cover_proxy redirect to them is revalidated on every use: quota eviction can
+# delete the target file, and a cached redirect would then point at a 404.
+COVER_IMMUTABLE_MAX_AGE = 365 * 86400
+# Cold covers streamed straight from cover_proxy carry the image itself.
+COVER_STREAM_MAX_AGE = 3600
+# Resized WebP variants served through srcset; covers render at 110px wide.
+COVER_VARIANT_WIDTHS = (120, 240, 360)
+COVER_VARIANT_QUALITY = 80
+COVER_PREFETCH_WORKERS = int(os.getenv("COVER_PREFETCH_WORKERS", "4"))
+COVER_PREFETCH_EXECUTOR = None
+COVER_PREFETCH_PENDING = set()
+COVER_PREFETCH_LOCK = threading.Lock()
+COVER_PREFETCH_STATS = {"queued": 0, "warmed": 0, "failed": 0}
+
+
+def record_cover_cache_stat(name, amount=1):
+    with COVER_CACHE_STATS_LOCK:
+        COVER_CACHE_STATS[name] += amount
+
+
+def ensure_cover_cache_schema():
+    """Create the local cover index and adopt any files cached before it existed."""
+
+    global COVER_CACHE_SCHEMA_READY
+    if COVER_CACHE_SCHEMA_READY:
+        return
+
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cover_cache (
+                lookup_key TEXT PRIMARY KEY,
+                file_name TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cover_cache_files (
+                file_name TEXT PRIMARY KEY,
+                size_bytes INTEGER NOT NULL DEFAULT 0,
+                last_access REAL NOT NULL DEFAULT 0,
+                content_hash TEXT
+            );
+            """
+        )
+        if "content_hash" not in get_table_columns(connection, "cover_cache_files"):
+            connection.execute("ALTER TABLE cover_cache_files ADD COLUMN content_hash TEXT")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cover_cache_files_hash ON cover_cache_files(content_hash)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cover_cache_files_access ON cover_cache_files(last_access)"
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cover_cache_misses (
+                lookup_key TEXT PRIMARY KEY,
+                failures INTEGER NOT NULL DEFAULT 0,
+                retry_at REAL NOT NULL DEFAULT 0
+            );
+            """
+        )
+
+        if COVERS_CACHE_DIR.exists():
+            known = {row[0] for row in connection.execute("SELECT file_name FROM cover_cache_files")}
+            for path in COVERS_CACHE_DIR.iterdir():
+                if path.is_file() and path.name not in known and not path.name.startswith("."):
+                    stat = path.stat()
+                    connection.execute(
+                        "INSERT OR IGNORE INTO cover_cache_files (file_name, size_bytes, last_access) VALUES (?, ?, ?)",
+                        [path.name, stat.st_size, stat.st_mtime],
+                    )
+    COVER_CACHE_SCHEMA_READY = True
+
+
+def touch_cached_cover(connection, file_name):
+    now = time.time()
+    connection.execute(
+        """
+        UPDATE cover_cache_files SET last_access = ?
+        WHERE file_name = ? AND last_access < ?
+        """,
+        [now, file_name, now - COVER_ACCESS_RESOLUTION_SECONDS],
+    )
+
+
+def enforce_cover_cache_quota(max_bytes=None):
+    """Evict least recently used cover files until the cache fits its quota."""
+
+    max_bytes = COVERS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    ensure_cover_cache_schema()
+
+    with open_local_db() as connection:
+        total = connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM cover_cache_files"
+        ).fetchone()[0]
+        if total <= max_bytes:
+            return 0
+
+        target = int(max_bytes * COVERS_CACHE_LOW_WATERMARK)
+        evicted = 0
+        for file_name, size_bytes in connection.execute(
+            "SELECT file_name, size_bytes FROM cover_cache_files ORDER BY last_access"
+        ).fetchall():
+            if total <= target:
+                break
+            try:
+                (COVERS_CACHE_DIR / file_name).unlink()
+            except FileNotFoundError:
+                pass
+            connection.execute("DELETE FROM cover_cache_files WHERE file_name = ?", [file_name])
+            connection.execute("DELETE FROM cover_cache WHERE file_name = ?", [file_name])
+            total -= size_bytes
+            evicted += 1
+            record_cover_cache_stat("evictions")
+            record_cover_cache_stat("evicted_bytes", size_bytes)
+
+    return evicted
+
+
+def cover_cache_summary():
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        files, total_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cover_cache_files"
+        ).fetchone()
+        lookups = connection.execute("SELECT COUNT(*) FROM cover_cache").fetchone()[0]
+        negative_entries = connection.execute(
+            "SELECT COUNT(*) FROM cover_cache_misses WHERE retry_at > ?", [time.time()]
+        ).fetchone()[0]
+
+    with COVER_CACHE_STATS_LOCK:
+        stats = dict(COVER_CACHE_STATS)
+
+    requests_seen = stats["hits"] + stats["misses"]
+    return {
+        "files": files,
+        "lookups": lookups,
+        "bytes": total_bytes,
+        "max_bytes": COVERS_CACHE_MAX_BYTES,
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "coalesced": stats["coalesced"],
+        "negative_hits": stats["negative_hits"],
+        "negative_entries": negative_entries,
+        "hit_ratio": round(stats["hits"] / requests_seen, 4) if requests_seen else None,
+        "evictions": stats["evictions"],
+        "evicted_bytes": stats["evicted_bytes"],
+    }
+
+
+def cover_lookup_key(original_url, title, author):
+    return hashlib.sha256(json.dumps([original_url, title, author]).encode()).hexdigest()
+
+
+def find_cached_cover(lookup_key):
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT file_name FROM cover_cache WHERE lookup_key = ?", [lookup_key]
+        ).fetchone()
+        if not row:
+            return None
+
+        cache_path = COVERS_CACHE_DIR / row[0]
+        if cache_path.exists():
+            touch_cached_cover(connection, row[0])
+            return cache_path
+
+        connection.execute("DELETE FROM cover_cache WHERE lookup_key = ?", [lookup_key])
+        connection.execute("DELETE FROM cover_cache_files WHERE file_name = ?", [row[0]])
+    return None
+
+
+def file_content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def record_cached_cover_file(connection, cache_path, content_hash=None):
+    content_hash = content_hash or file_content_hash(cache_path)
+    connection.execute(
+        """
+        INSERT INTO cover_cache_files (file_name, size_bytes, last_access, content_hash)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(file_name) DO UPDATE SET
+            size_bytes = excluded.size_bytes,
+            last_access = excluded.last_access,
+            content_hash = excluded.content_hash
+        """,
+        [cache_path.name, cache_path.stat().st_size, time.time(), content_hash],
+    )
+    return content_hash
+
+
+def cover_content_hash(cache_path):
+    """Return the sha256 of a cached cover, hashing files adopted before it was stored."""
+
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT content_hash FROM cover_cache_files WHERE file_name = ?", [cache_path.name]
+        ).fetchone()
+        if row and row[0]:
+            return row[0]
+        return record_cached_cover_file(connection, cache_path)
+
+
+def find_cover_by_hash(content_hash):
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT file_name FROM cover_cache_files WHERE content_hash = ?", [content_hash]
+        ).fetchone()
+        if not row:
+            return None
+
+        cache_path = COVERS_CACHE_DIR / row[0]
+        if not cache_path.exists():
+            return None
+        touch_cached_cover(connection, row[0])
+    return cache_path
+
+
+def remember_cached_cover(lookup_key, cache_path):
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        connection.execute(
+            """
+            INSERT INTO cover_cache (lookup_key, file_name)
+            VALUES (?, ?)
+            ON CONFLICT(lookup_key) DO UPDATE SET file_name = excluded.file_name
+            """,
+            [lookup_key, cache_path.name],
+        )
+        record_cached_cover_file(connection, cache_path)
+        connection.execute("DELETE FROM cover_cache_misses WHERE lookup_key = ?", [lookup_key])
+
+    enforce_cover_cache_quota()
+
+
+def cover_miss_pending(lookup_key):
+    """Return True while a recently unresolvable cover is still backing off."""
+
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT retry_at FROM cover_cache_misses WHERE lookup_key = ?", [lookup_key]
+        ).fetchone()
+    return bool(row) and row[0] > time.time()
+
+
+def remember_cover_miss(lookup_key):
+    ensure_cover_cache_schema()
+    with open_local_db() as connection:
+        row = connection.execute(
+            "SELECT failures FROM cover_cache_misses WHERE lookup_key = ?", [lookup_key]
+        ).fetchone()
+        failures = (row[0] if row else 0) + 1
+        delay = min(COVER_MISS_RETRY_SECONDS * 2 ** (failures - 1), COVER_MISS_MAX_RETRY_SECONDS)
+        connection.execute(
+            """
+            INSERT INTO cover_cache_misses (lookup_key, failures, retry_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(lookup_key) DO UPDATE SET
+                failures = excluded.failures,
+                retry_at = excluded.retry_at
+            """,
+            [lookup_key, failures, time.time() + delay],
+        )
+
+
+def google_books_cover_url(title, author):
+    from urllib.parse import quote_plus
+
+    query = " ".join(filter(None, [title, author]))
+    google_api = f"https://www.googleapis.com/books/v1/volumes?q={quote_plus(query)}&maxResults=1"
+    try:
+        api_response = http_request("GET", google_api, timeout=8)
+        api_response.raise_for_status()
+        payload = api_response.json()
+        items = payload.get("items") or []
+        if items:
+            image_links = (items[0].get("volumeInfo") or {}).get("imageLinks") or {}
+            thumbnail = image_links.get("large") or image_links.get("medium") or image_links.get("thumbnail")
+            if thumbnail:
+                return thumbnail.replace("http://", "https://")
+    except Exception:
+        pass
+
+    return None
+
+
+def cover_cache_path(candidate_urls):
+    # Use all candidate URLs in hash so cache key is stable for same inputs.
+    cache_key = "|".join(candidate_urls)
+    ext = ".jpg"
+    for candidate in candidate_urls:
+        lower = candidate.lower()
+        for suffix in (".png", ".gif", ".webp", ".jpg", ".jpeg"):
+            if suffix in lower:
+                ext = suffix
+                break
+
+    cache_name = hashlib.md5(cache_key.encode()).hexdigest() + ext
+    return COVERS_CACHE_DIR / cache_name
+
+
+def cover_temp_path(destination_path):
+    return destination_path.with_name(f".{destination_path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def cover_candidate_urls(original_url, title, author):
+    """Yield cover URLs to try, asking Google Books only once the original has failed."""
+
+    if original_url.startswith("http"):
+        yield original_url
+    if title:
+        thumbnail = google_books_cover_url(title, author)
+        if thumbnail:
+            yield thumbnail
+
+
+def open_cover_download(target_url):
+    response = http_request("GET", target_url, headers=COVER_FETCH_HEADERS, timeout=12, stream=True)
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    return response
+
+
+def tee_cover_download(response, destination_path):
+    """Yield a download's chunks while writing them to a temp file.
+
+    The temp file only replaces ``destination_path`` after the last chunk, so a
+    download that errors or is abandoned mid-way never leaves a partial cover.
+    """
+
+    temp_path = cover_temp_path(destination_path)
+    try:
+        with open(temp_path, "wb") as handle:
+            for chunk in response.iter_content(8192):
+                if chunk:
+                    handle.write(chunk)
+                    yield chunk
+        os.replace(temp_path, destination_path)
+    finally:
+        response.close()
+        temp_path.unlink(missing_ok=True)
+
+
+def fetch_cover_image(target_url, destination_path):
+    """Download into a temp file and rename it into place once complete."""
+
+    for _ in tee_cover_download(open_cover_download(target_url), destination_path):
+        pass
+
+
+def claim_cover_flight(lookup_key):
+    """Return ``(flight, is_leader)`` for a key, registering a new flight if none is running."""
+
+    with COVER_FLIGHTS_LOCK:
+        flight = COVER_FLIGHTS.get(lookup_key)
+        if flight:
+            return flight, False
+        flight = {"done": threading.Event(), "result": None}
+        COVER_FLIGHTS[lookup_key] = flight
+        return flight, True
+
+
+def finish_cover_flight(lookup_key, flight, result, abandoned=False):
+    flight["result"] = result
+    flight["abandoned"] = abandoned
+    with COVER_FLIGHTS_LOCK:
+        COVER_FLIGHTS.pop(lookup_key, None)
+    flight["done"].set()
+
+
+def run_cover_flight(lookup_key, resolver):
+    """Run ``resolver`` once per key; concurrent callers wait for its result."""
+
+    flight, is_leader = claim_cover_flight(lookup_key)
+    if not is_leader:
+        record_cover_cache_stat("coalesced")
+        flight["done"].wait(COVER_FLIGHT_WAIT_SECONDS)
+        if flight.get("abandoned"):
+            return run_cover_flight(lookup_key, resolver)
+        return flight["result"]
+
+    result = None
+    try:
+        result = resolver()
+        return result
+    finally:
+        finish_cover_flight(lookup_key, flight, result)
+
+
+def resolve_cover(original_url, title, author):
+    """Return the cached cover file for a book, fetching it on a miss.
+
+    The (url, title, author) index is consulted first so a warm cover never
+    costs a Google Books lookup or any other outbound request.
+    """
+
+    lookup_key = cover_lookup_key(original_url, title, author)
+    cached = find_cached_cover(lookup_key)
+    if cached:
+        record_cover_cache_stat("hits")
+        return cached
+
+    if cover_miss_pending(lookup_key):
+        record_cover_cache_stat("negative_hits")
+        return None
+
+    return run_cover_flight(
+        lookup_key, lambda: fetch_and_cache_cover(lookup_key, original_url, title, author)
+    )
+
+
+def fetch_and_cache_cover(lookup_key, original_url, title, author):
+    # A flight that finished between our index check and joining may have filled it.
+    cached = find_cached_cover(lookup_key)
+    if cached:
+        record_cover_cache_stat("hits")
+        return cached
+
+    record_cover_cache_stat("misses")
+    COVERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    for candidate in cover_candidate_urls(original_url, title, author):
+        cache_path = cover_cache_path([candidate])
+        if not cache_path.exists():
+            try:
+                fetch_cover_image(candidate, cache_path)
+            except Exception:
+                continue
+        remember_cached_cover(lookup_key, cache_path)
+        return cache_path
+
+    remember_cover_miss(lookup_key)
+    return None
+
+
+def stream_cold_cover(lookup_key, original_url, title, author):
+    """Send a cold cover to the client while it is being downloaded into the cache.
+
+    Returns None when this request should not stream: another request already
+    owns the fetch, the cover is backing off after failures, or a candidate
+    file is already on disk. The caller then falls back to ``resolve_cover``.
+    """
+
+    import mimetypes
+
+    if cover_miss_pending(lookup_key):
+        return None
+
+    flight, is_leader = claim_cover_flight(lookup_key)
+    if not is_leader:
+        return None
+
+    try:
+        COVERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for candidate in cover_candidate_urls(original_url, title, author):
+            cache_path = cover_cache_path([candidate])
+            if cache_path.exists():
+                remember_cached_cover(lookup_key, cache_path)
+                finish_cover_flight(lookup_key, flight, cache_path)
+                return None
+            try:
+                download = open_cover_download(candidate)
+            except Exception:
+                continue
+
+            record_cover_cache_stat("misses")
+            mime = download.headers.get("Content-Type", "").split(";")[0].strip()
+            if not mime.startswith("image/"):
+                mime = mimetypes.guess_type(str(cache_path))[0] or "image/jpeg"
+            response = Response(
+                stream_cover_download(lookup_key, flight, download, cache_path), mimetype=mime
+            )
+            response.call_on_close(lambda: close_cover_stream(lookup_key, flight, download))
+            response.cache_control.public = True
+            response.cache_control.max_age = COVER_STREAM_MAX_AGE
+            return response
+    except Exception:
+        finish_cover_flight(lookup_key, flight, None)
+        raise
+
+    record_cover_cache_stat("misses")
+    remember_cover_miss(lookup_key)
+    finish_cover_flight(lookup_key, flight, None)
+    return cover_placeholder_response(title)
+
+
+def stream_cover_download(lookup_key, flight, download, cache_path):
+    result = None
+    abandoned = False
+    try:
+        yield from tee_cover_download(download, cache_path)
+        remember_cached_cover(lookup_key, cache_path)
+        result = cache_path
+    except GeneratorExit:
+        # The client went away mid-download; waiting requests fetch it themselves.
+        abandoned = True
+        raise
+    finally:
+        finish_cover_flight(lookup_key, flight, result, abandoned)
+
+
+def close_cover_stream(lookup_key, flight, download):
+    """Release a streamed fetch when its response closes, even if the body was never read."""
+
+    download.close()
+    if not flight["done"].is_set():
+        finish_cover_flight(lookup_key, flight, None, abandoned=True)
+
+
+def cover_variant_width(requested_width):
+    """Snap a requested width up to the nearest fixed variant width."""
+
+    for width in COVER_VARIANT_WIDTHS:
+        if requested_width <= width:
+            return width
+    return COVER_VARIANT_WIDTHS[-1]
+
+
+def cover_variant_path(cache_path, width):
+    return cache_path.with_name(f"{cache_path.stem}.w{width}.webp")
+
+
+def build_cover_variant(cache_path, variant_path, width):
+    """Write a downscaled WebP copy of a cached cover, or None without Pillow."""
+
+    try:
+        from PIL import Image
+    except ModuleNotFoundError:
+        return None
+
+    temp_path = cover_temp_path(variant_path)
+    try:
+        with Image.open(cache_path) as image:
+            image.thumbnail((width, width * 4))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            image.save(temp_path, "WEBP", quality=COVER_VARIANT_QUALITY)
+        os.replace(temp_path, variant_path)
+    except Exception:
+        return None
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    with open_local_db() as connection:
+        record_cached_cover_file(connection, variant_path)
+    enforce_cover_cache_quota()
+    return variant_path if variant_path.exists() else None
 
-    for tool in CALMING_TOOLS:
-        slug = tool.get("slug", slugify(tool["title"]))
-        count = counts.get(slug, {"completed": 0, "views": 0})
-        updated[slug] = count
-        tools_with_counts.append(
-            {
-                **tool,
-                "slug": slug,
-                "completed_count": count.get("completed", 0),
-                "view_count": count.get("views", 0),
-            }
-        )
 
-    if counts.keys() != updated.keys():
-        save_calming_counts(updated)
+def resolve_cover_variant(cache_path, width):
+    variant_path = cover_variant_path(cache_path, width)
+    if variant_path.exists():
+        with open_local_db() as connection:
+            touch_cached_cover(connection, variant_path.name)
+        return variant_path
 
-    return tools_with_counts
+    return run_cover_flight(
+        f"variant:{variant_path.name}",
+        lambda: build_cover_variant(cache_path, variant_path, width),
+    )
 
 
-def calming_tool_cards():
-    counts = load_calming_counts()
-    cards = []
+def warm_cover(book):
+    """Fetch a book's cover and build its srcset variants ahead of any visitor."""
 
-    for page in CALMING_TOOL_PAGES:
-        count_slug = page.get("count_slug") or page["slug"]
-        count = counts.get(count_slug, {"completed": 0, "views": 0})
-        cards.append(
-            {
-                **page,
-                "completed_count": count.get("completed", 0),
-                "view_count": count.get("views", 0),
-            }
-        )
+    # Strip like cover_proxy does so the lookup key matches the page's request.
+    cache_path = resolve_cover(
+        (book.get("cover_url") or "").strip(),
+        (book.get("title") or "").strip(),
+        (book.get("author") or "").strip(),
+    )
+    if not cache_path:
+        return False
 
-    return cards
+    for width in COVER_VARIANT_WIDTHS:
+        resolve_cover_variant(cache_path, width)
+    return True
 
 
-def find_calming_tool(slug):
-    for tool in CALMING_TOOLS:
-        if tool.get("slug") == slug:
-            return tool
-    return None
+def run_cover_prefetch(lookup_key, book):
+    try:
+        warmed = warm_cover(book)
+    except Exception:
+        warmed = False
 
-COMMUNITY_HIGHLIGHTS = [
-    {
-        "title": "Peer Circles",
-        "description": "Weekly online spaces where you can share, listen, or simply sit with others who understand.",
-    },
-    {
-        "title": "Story Spotlights",
-        "description": "Gentle, anonymous stories from people who found support and kept going—proof that healing is possible.",
-    },
-    {
-        "title": "Resource Swaps",
-        "description": "A living list where the community adds podcasts, books, and practices that help them feel grounded.",
-    },
-]
+    with COVER_PREFETCH_LOCK:
+        COVER_PREFETCH_PENDING.discard(lookup_key)
+        COVER_PREFETCH_STATS["warmed" if warmed else "failed"] += 1
 
 
-@app.route("/")
-def index():
-    books = books_with_indices(load_books())
-    charities = load_charities()
-    did_you_know_items = load_did_you_know_items()
-    return render_template(
-        "home.html",
-        resources=RESOURCES,
-        books=books,
-        charities=charities,
-        did_you_know_items=did_you_know_items,
-    )
+def prefetch_covers(books):
+    """Queue cover warming on a bounded worker pool; returns how many were queued."""
 
+    global COVER_PREFETCH_EXECUTOR
 
-@app.route("/books")
-def books():
-    book_list = books_with_indices(load_books())
-    return render_template("books.html", books=book_list)
+    queued = 0
+    with COVER_PREFETCH_LOCK:
+        if COVER_PREFETCH_EXECUTOR is None:
+            from concurrent.futures import ThreadPoolExecutor
 
+            COVER_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+                max_workers=COVER_PREFETCH_WORKERS, thread_name_prefix="cover-prefetch"
+            )
 
-COVERS_CACHE_DIR = BASE_DIR / "static" / "covers_cache"
+        for book in books:
+            if not (book.get("cover_url") or book.get("title")):
+                continue
+            lookup_key = cover_lookup_key(
+                (book.get("cover_url") or "").strip(),
+                (book.get("title") or "").strip(),
+                (book.get("author") or "").strip(),
+            )
+            if lookup_key in COVER_PREFETCH_PENDING:
+                continue
+            COVER_PREFETCH_PENDING.add(lookup_key)
+            COVER_PREFETCH_STATS["queued"] += 1
+            COVER_PREFETCH_EXECUTOR.submit(run_cover_prefetch, lookup_key, book)
+            queued += 1
 
-@app.route("/cover-proxy")
-def cover_proxy():
-    """Fetch a book cover server-side with fallbacks, cache it, and return it."""
-    import hashlib
-    import mimetypes
-    from urllib.parse import quote_plus
-    import requests as req_lib
+    return queued
 
-    def fetch_image(target_url, destination_path):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36",
-            "Referer": "https://www.google.com/",
-            "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+
+def cover_prefetch_summary():
+    with COVER_PREFETCH_LOCK:
+        return {
+            **COVER_PREFETCH_STATS,
+            "pending": len(COVER_PREFETCH_PENDING),
+            "workers": COVER_PREFETCH_WORKERS,
         }
-        response = req_lib.get(target_url, headers=headers, timeout=12, stream=True)
-        response.raise_for_status()
-        with open(destination_path, "wb") as handle:
-            for chunk in response.iter_content(8192):
-                if chunk:
-                    handle.write(chunk)
 
-    def placeholder_svg(book_title):
-        safe_title = (book_title or "Book cover unavailable").replace("<", "").replace(">", "")
-        svg = f"""<svg xmlns='http://www.w3.org/2000/svg' width='320' height='480' viewBox='0 0 320 480'>
+
+def cover_placeholder_response(book_title):
+    safe_title = (book_title or "Book cover unavailable").replace("<", "").replace(">", "")
+    svg = f"""<svg xmlns='http://www.w3.org/2000/svg' width='320' height='480' viewBox='0 0 320 480'>
 <rect width='320' height='480' fill='#1f2937'/>
 <rect x='24' y='24' width='272' height='432' rx='18' fill='#111827' stroke='#334155' stroke-width='2'/>
 <text x='160' y='220' text-anchor='middle' fill='#cbd5e1' font-size='20' font-family='Arial'>📖</text>
 <text x='160' y='260' text-anchor='middle' fill='#cbd5e1' font-size='15' font-family='Arial'>Cover unavailable</text>
 <text x='160' y='292' text-anchor='middle' fill='#94a3b8' font-size='12' font-family='Arial'>{safe_title[:36]}</text>
 </svg>"""
-        return Response(svg, mimetype="image/svg+xml")
+    response = Response(svg, mimetype="image/svg+xml")
+    response.cache_control.public = True
+    response.cache_control.max_age = COVER_PLACEHOLDER_MAX_AGE
+    return response
+
+
+@app.route("/cover-proxy")
+def cover_proxy():
+    """Stream a cold book cover, or redirect a cached one to its fingerprinted URL."""
 
     original_url = request.args.get("url", "").strip()
     title = request.args.get("title", "").strip()
     author = request.args.get("author", "").strip()
 
-    candidate_urls = []
-    if original_url.startswith("http"):
-        candidate_urls.append(original_url)
-
-    if title:
-        query_bits = [title]
-        if author:
-            query_bits.append(author)
-        query = " ".join(query_bits)
-        google_api = f"https://www.googleapis.com/books/v1/volumes?q={quote_plus(query)}&maxResults=1"
-        try:
-            api_response = req_lib.get(google_api, timeout=8)
-            api_response.raise_for_status()
-            payload = api_response.json()
-            items = payload.get("items") or []
-            if items:
-                image_links = (items[0].get("volumeInfo") or {}).get("imageLinks") or {}
-                thumbnail = image_links.get("large") or image_links.get("medium") or image_links.get("thumbnail")
-                if thumbnail:
-                    candidate_urls.append(thumbnail.replace("http://", "https://"))
-        except Exception:
-            pass
-
-    if not candidate_urls:
-        return placeholder_svg(title)
+    requested_width = request.args.get("w", type=int)
+    lookup_key = cover_lookup_key(original_url, title, author)
+    cache_path = find_cached_cover(lookup_key)
+    if cache_path:
+        record_cover_cache_stat("hits")
+    else:
+        # Cold covers are streamed to GETs as they download; variants follow on later requests.
+        streamed = None
+        if request.method == "GET":
+            streamed = stream_cold_cover(lookup_key, original_url, title, author)
+        if streamed is not None:
+            if requested_width:
+                streamed.vary.add("Accept")
+            return streamed
+        cache_path = resolve_cover(original_url, title, author)
+
+    if not cache_path:
+        return cover_placeholder_response(title)
+
+    # Only browsers that advertise WebP get the resized variant.
+    variant_path = None
+    if requested_width and "image/webp" in request.headers.get("Accept", ""):
+        variant_path = resolve_cover_variant(cache_path, cover_variant_width(requested_width))
+
+    target_path = variant_path or cache_path
+    response = redirect(
+        url_for(
+            "immutable_cover",
+            content_hash=cover_content_hash(target_path),
+            extension=target_path.suffix.lstrip("."),
+        )
+    )
+    response.cache_control.no_cache = True
+    if requested_width:
+        response.vary.add("Accept")
+    return response
 
-    # Use all candidate URLs in hash so cache key is stable for same inputs.
-    cache_key = "|".join(candidate_urls)
-    ext = ".jpg"
-    for candidate in candidate_urls:
-        lower = candidate.lower()
-        for suffix in (".png", ".gif", ".webp", ".jpg", ".jpeg"):
-            if suffix in lower:
-                ext = suffix
-                break
 
-    cache_name = hashlib.md5(cache_key.encode()).hexdigest() + ext
-    COVERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    cache_path = COVERS_CACHE_DIR / cache_name
+@app.route("/covers/<content_hash>.<extension>")
+def immutable_cover(content_hash, extension):
+    """Serve a cached cover by content hash with a strong ETag and a one-year lifetime."""
+    import mimetypes
 
-    if not cache_path.exists():
-        fetched = False
-        for candidate in candidate_urls:
-            try:
-                fetch_image(candidate, cache_path)
-                fetched = True
-                break
-            except Exception:
-                continue
-        if not fetched:
-            return placeholder_svg(title)
+    cache_path = find_cover_by_hash(content_hash)
+    if not cache_path or cache_path.suffix.lstrip(".") != extension:
+        # Evicted covers come back under the same hash once cover_proxy refetches them.
+        response = Response("Cover not found.", status=404, mimetype="text/plain")
+        response.cache_control.no_store = True
+        return response
 
     mime = mimetypes.guess_type(str(cache_path))[0] or "image/jpeg"
-    return send_file(cache_path, mimetype=mime, max_age=86400 * 7)
+    response = send_file(
+        cache_path, mimetype=mime, etag=content_hash, max_age=COVER_IMMUTABLE_MAX_AGE
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 
 @app.route("/books/<slug>/view", methods=["POST"])
@@ -2631,65 +4939,69 @@ Your task: {random_direction}"""
     )
 
 
-def deepseek_chat_reply(api_key, message, history=None, warmup=False, topic="", single_message=False, reply_to_user=False, last_speaker="", all_participants=None):
-    history = history or []
-    all_participants = all_participants or []
+def chat_reply_prompt(message, history, warmup=False, topic="", single_message=False, reply_to_user=False, last_speaker="", all_participants=None):
+    return [
+        {
+            "role": "system",
+            "content": (
+                "Generate brief natural chat messages. Use names naturally (NO @ symbol ever). "
+                "ALWAYS respond when someone asks you something. Max 7 words. Real texting vibes."
+            ),
+        },
+        {
+            "role": "user",
+            "content": build_chat_prompt(
+                [],  # Roster not used anymore
+                history or [],
+                message,
+                warmup=warmup,
+                topic=topic,
+                single_message=single_message,
+                reply_to_user=reply_to_user,
+                last_speaker=last_speaker,
+                all_participants=all_participants or [],
+            ),
+        },
+    ]
 
-    payload = {
-        "model": "deepseek-chat",
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                    "Generate brief natural chat messages. Use names naturally (NO @ symbol ever). "
-                    "ALWAYS respond when someone asks you something. Max 7 words. Real texting vibes."
-                ),
-            },
-            {
-                "role": "user",
-                "content": build_chat_prompt(
-                    [],  # Roster not used anymore
-                    history,
-                    message,
-                    warmup=warmup,
-                    topic=topic,
-                    single_message=single_message,
-                    reply_to_user=reply_to_user,
-                    last_speaker=last_speaker,
-                    all_participants=all_participants,
-                ),
-            },
-        ],
-        "temperature": 0.85,  # Good variety but more focused
-        "max_tokens": 60,  # Shorter max to enforce brevity
-    }
 
-    request_data = json.dumps(payload).encode("utf-8")
-    request_headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+def normalize_chat_reply_item(item):
+    """Turn one generated item into a chat message dict, or None if it isn't usable."""
 
-    try:
-        req = urlrequest.Request(
-            "https://api.deepseek.com/chat/completions",
-            data=request_data,
-            headers=request_headers,
-        )
-        with urlrequest.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:  # pragma: no cover - external dependency
-        return None, f"DeepSeek request failed: {exc.reason or exc.code}"
-    except URLError as exc:  # pragma: no cover - external dependency
-        return None, f"DeepSeek request failed: {getattr(exc, 'reason', exc)}"
-    except Exception as exc:  # pragma: no cover - network variability
-        return None, f"DeepSeek lookup error: {exc}"
-
-    content = (
-        (result.get("choices") or [{}])[0]
-        .get("message", {})
-        .get("content", "")
+    if not isinstance(item, dict):
+        return None
+    sender = (item.get("sender") or "Peer").strip() or "Peer"
+    role = (item.get("role") or "peer").strip().lower()
+    role = "mod" if role == "mod" else "peer"
+    text = (item.get("text") or "").strip()
+    if not text:
+        return None
+
+    # Add realistic text modifications (typos, slang, x's for women)
+    text = add_realistic_text_style(text, sender)
+
+    return {"sender": sender[:40], "role": role, "text": text[:500]}
+
+
+def deepseek_chat_reply(api_key, message, history=None, warmup=False, topic="", single_message=False, reply_to_user=False, last_speaker="", all_participants=None):
+    content, error = deepseek_completion(
+        api_key,
+        chat_reply_prompt(
+            message,
+            history,
+            warmup=warmup,
+            topic=topic,
+            single_message=single_message,
+            reply_to_user=reply_to_user,
+            last_speaker=last_speaker,
+            all_participants=all_participants,
+        ),
+        "chat_reply",
+        temperature=0.85,  # Good variety but more focused
+        max_tokens=60,  # Shorter max to enforce brevity
     )
+    if error:
+        return None, error
 
     parsed = extract_json_object(content)
     
@@ -2707,22 +5019,7 @@ def deepseek_chat_reply(api_key, message, history=None, warmup=False, topic="",
         else:
             return None, "Unable to parse DeepSeek response."
 
-    messages = []
-
-    for item in parsed:
-        if not isinstance(item, dict):
-            continue
-        sender = (item.get("sender") or "Peer").strip() or "Peer"
-        role = (item.get("role") or "peer").strip().lower()
-        role = "mod" if role == "mod" else "peer"
-        text = (item.get("text") or "").strip()
-        if not text:
-            continue
-        
-        # Add realistic text modifications (typos, slang, x's for women)
-        text = add_realistic_text_style(text, sender)
-        
-        messages.append({"sender": sender[:40], "role": role, "text": text[:500]})
+    messages = [reply for reply in (normalize_chat_reply_item(item) for item in parsed) if reply]
 
     if not messages:
         return None, "DeepSeek returned no usable messages."
@@ -2730,6 +5027,74 @@ def deepseek_chat_reply(api_key, message, history=None, warmup=False, topic="",
     return messages, None
 
 
+class JSONObjectStream:
+    """Pull complete JSON objects out of text that arrives in pieces.
+
+    Objects are returned as soon as their closing brace arrives, innermost first,
+    so the items of a streamed ``[{...}, {...}]`` array surface one at a time.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.position = 0
+        self.starts = []
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk):
+        self.text += chunk
+        objects = []
+        while self.position < len(self.text):
+            char = self.text[self.position]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = bool(self.starts)
+            elif char == "{":
+                self.starts.append(self.position)
+            elif char == "}" and self.starts:
+                start = self.starts.pop()
+                try:
+                    objects.append(json.loads(self.text[start : self.position + 1]))
+                except json.JSONDecodeError:
+                    pass
+            self.position += 1
+
+        if not self.starts:
+            self.text, self.position = "", 0
+        return objects
+
+
+def deepseek_chat_reply_stream(api_key, message, history=None, **options):
+    """Yield ``(reply, None)`` for each message as soon as it parses, then ``(None, error)`` if none did."""
+
+    parser = JSONObjectStream()
+    sent = 0
+    error = None
+    for delta, error in deepseek_completion_stream(
+        api_key,
+        chat_reply_prompt(message, history, **options),
+        "chat_reply_stream",
+        temperature=0.85,
+        max_tokens=60,
+    ):
+        if error:
+            break
+        for item in parser.feed(delta):
+            reply = normalize_chat_reply_item(item)
+            if reply:
+                sent += 1
+                yield reply, None
+
+    if not sent:
+        yield None, error or "DeepSeek returned no usable messages."
+
+
 def add_realistic_text_style(text, sender_name=""):
     """Add realistic typos, slang, and style to messages"""
     import random
@@ -2867,62 +5232,63 @@ def add_realistic_text_style(text, sender_name=""):
     return text
 
 
+# Canned replies used when no DeepSeek key is configured.
+CHAT_FALLBACK_REPLIES = [
+    {"sender": "Peer", "role": "peer", "text": "hey! glad ur here 😊"},
+    {"sender": "Peer", "role": "peer", "text": "just sitting with my thoughts today"},
+    {"sender": "Peer", "role": "peer", "text": "you've got this!! 💪"},
+    {"sender": "Peer", "role": "peer", "text": "yeah same tbh"},
+    {"sender": "Peer", "role": "peer", "text": "been a rough one ngl"},
+    {"sender": "Peer", "role": "peer", "text": "trying to stay focused lol"},
+    {"sender": "Peer", "role": "peer", "text": "feeling pretty low tonite"},
+    {"sender": "Peer", "role": "peer", "text": "anxiety's been hitting diferent lately"},
+    {"sender": "Peer", "role": "peer", "text": "we're all in this together ❤️"},
+    {"sender": "Peer", "role": "peer", "text": "just vibing honestly"},
+    {"sender": "Peer", "role": "peer", "text": "lowkey strugglign but im here"},
+    {"sender": "Peer", "role": "peer", "text": "anyone else procrastinating rn? 😅"},
+    {"sender": "Peer", "role": "peer", "text": "thats so real"},
+    {"sender": "Peer", "role": "peer", "text": "mood lmao"},
+    {"sender": "Peer", "role": "peer", "text": "fr fr"},
+    {"sender": "Peer", "role": "peer", "text": "felt that tbh"},
+    {"sender": "Peer", "role": "peer", "text": "omg sameee"},
+    {"sender": "Peer", "role": "peer", "text": "yesss exactly"},
+    {"sender": "Peer", "role": "peer", "text": "ughhh i feel u"},
+    {"sender": "Peer", "role": "peer", "text": "honestly tho"},
+    {"sender": "Peer", "role": "peer", "text": "sooo true lol"},
+    {"sender": "Peer", "role": "peer", "text": "wait what happend?"},
+    {"sender": "Peer", "role": "peer", "text": "oh nooo"},
+    {"sender": "Peer", "role": "peer", "text": "thats rough ngl"},
+]
+
+
+def chat_reply_options(data):
+    return {
+        "warmup": bool(data.get("warmup")),
+        "topic": (data.get("topic") or get_chat_topic() or "").strip(),
+        "single_message": bool(data.get("singleMessage")),
+        "reply_to_user": bool(data.get("replyToUser")),
+        "last_speaker": (data.get("lastSpeaker") or "").strip(),
+        "all_participants": data.get("participants") or [],
+    }
+
+
 @app.route("/api/chat/reply", methods=["POST"])
 def chat_reply():
     data = request.get_json(silent=True) or {}
     message = (data.get("message") or "").strip()
     history = data.get("history") or []
-    warmup = bool(data.get("warmup"))
-    single_message = bool(data.get("singleMessage"))
-    reply_to_user = bool(data.get("replyToUser"))
-    topic = (data.get("topic") or get_chat_topic() or "").strip()
-    last_speaker = (data.get("lastSpeaker") or "").strip()
-    all_participants = data.get("participants") or []
-
-    if not message and not warmup:
+    options = chat_reply_options(data)
+
+    if not message and not options["warmup"]:
         return {"error": "Please share a message so the room can reply."}, 400
 
     api_key = get_deepseek_api_key().strip()
     if not api_key:
         # Fallback responses when no API key is configured
         import random
-        short_fallbacks = [
-            {"sender": "Peer", "role": "peer", "text": "hey! glad ur here 😊"},
-            {"sender": "Peer", "role": "peer", "text": "just sitting with my thoughts today"},
-            {"sender": "Peer", "role": "peer", "text": "you've got this!! 💪"},
-            {"sender": "Peer", "role": "peer", "text": "yeah same tbh"},
-            {"sender": "Peer", "role": "peer", "text": "been a rough one ngl"},
-            {"sender": "Peer", "role": "peer", "text": "trying to stay focused lol"},
-            {"sender": "Peer", "role": "peer", "text": "feeling pretty low tonite"},
-            {"sender": "Peer", "role": "peer", "text": "anxiety's been hitting diferent lately"},
-            {"sender": "Peer", "role": "peer", "text": "we're all in this together ❤️"},
-            {"sender": "Peer", "role": "peer", "text": "just vibing honestly"},
-            {"sender": "Peer", "role": "peer", "text": "lowkey strugglign but im here"},
-            {"sender": "Peer", "role": "peer", "text": "anyone else procrastinating rn? 😅"},
-            {"sender": "Peer", "role": "peer", "text": "thats so real"},
-            {"sender": "Peer", "role": "peer", "text": "mood lmao"},
-            {"sender": "Peer", "role": "peer", "text": "fr fr"},
-            {"sender": "Peer", "role": "peer", "text": "felt that tbh"},
-            {"sender": "Peer", "role": "peer", "text": "omg sameee"},
-            {"sender": "Peer", "role": "peer", "text": "yesss exactly"},
-            {"sender": "Peer", "role": "peer", "text": "ughhh i feel u"},
-            {"sender": "Peer", "role": "peer", "text": "honestly tho"},
-            {"sender": "Peer", "role": "peer", "text": "sooo true lol"},
-            {"sender": "Peer", "role": "peer", "text": "wait what happend?"},
-            {"sender": "Peer", "role": "peer", "text": "oh nooo"},
-            {"sender": "Peer", "role": "peer", "text": "thats rough ngl"},
-        ]
-        return {"messages": [random.choice(short_fallbacks)]}
+        return {"messages": [random.choice(CHAT_FALLBACK_REPLIES)]}
 
-    replies, error = deepseek_chat_reply(
-        api_key, message, history, 
-        warmup=warmup, 
-        topic=topic, 
-        single_message=single_message,
-        reply_to_user=reply_to_user,
-        last_speaker=last_speaker,
-        all_participants=all_participants
-    )
+    replies, error = deepseek_chat_reply(api_key, message, history, **options)
     if error:
         # Return error flag so frontend can handle silently
         return {"messages": [], "error": "temporarily_unavailable"}
@@ -2930,6 +5296,43 @@ def chat_reply():
     return {"messages": replies}
 
 
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+@app.route("/api/chat/reply/stream", methods=["POST"])
+def chat_reply_stream():
+    """Server-Sent Events version of chat_reply: each message is sent as soon as it parses."""
+
+    data = request.get_json(silent=True) or {}
+    message = (data.get("message") or "").strip()
+    history = data.get("history") or []
+    options = chat_reply_options(data)
+
+    if not message and not options["warmup"]:
+        return {"error": "Please share a message so the room can reply."}, 400
+
+    api_key = get_deepseek_api_key().strip()
+
+    def generate():
+        if not api_key:
+            import random
+            yield sse_event("message", random.choice(CHAT_FALLBACK_REPLIES))
+        else:
+            for reply, error in deepseek_chat_reply_stream(api_key, message, history, **options):
+                if error:
+                    yield sse_event("error", {"error": "temporarily_unavailable"})
+                    break
+                yield sse_event("message", reply)
+        yield sse_event("done", {})
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/api/chat/generate-names", methods=["POST"])
 def generate_chat_names():
     """Generate random unique names for chat participants using AI"""
@@ -2965,32 +5368,20 @@ Return ONLY a JSON array of strings with just the first names, like:
 
 Generate {count} completely different names each time - be creative!"""
 
-    payload = {
-        "model": "deepseek-chat",
-        "messages": [
-            {"role": "system", "content": "You generate realistic names. Respond with only JSON."},
-            {"role": "user", "content": prompt},
-        ],
-        "temperature": 1.0,  # High temperature for variety
-        "max_tokens": 200,
-    }
-
     try:
-        request_data = json.dumps(payload).encode("utf-8")
-        request_headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        }
-        req = urlrequest.Request(
-            "https://api.deepseek.com/v1/chat/completions",
-            data=request_data,
-            headers=request_headers,
+        content, error = deepseek_completion(
+            api_key,
+            [
+                {"role": "system", "content": "You generate realistic names. Respond with only JSON."},
+                {"role": "user", "content": prompt},
+            ],
+            "names",
+            temperature=1.0,  # High temperature for variety
+            max_tokens=200,
         )
-        with urlrequest.urlopen(req, timeout=15) as response:
-            result = json.loads(response.read().decode("utf-8"))
-        
-        content = (result.get("choices") or [{}])[0].get("message", {}).get("content", "")
-        
+        if error:
+            raise RuntimeError(error)
+
         # Parse the response
         names = None
         try:
@@ -3087,9 +5478,8 @@ def build_dataset_summary(books):
     }
 
 
-def render_admin_page(message=None, save_summary=None, load_summary=None, section=None):
-    view_counts = load_book_view_counts()
-    books = books_with_indices(load_books(), view_counts=view_counts)
+def render_admin_page(message=None, save_summary=None, load_summary=None, section=None, import_report=None):
+    books = books_with_indices(load_books())
     charities = load_charities()
     charity_activities = load_charity_activities()
     did_you_know_items = load_did_you_know_items()
@@ -3118,6 +5508,7 @@ def render_admin_page(message=None, save_summary=None, load_summary=None, sectio
         contact_messages=contact_messages,
         save_summary=save_summary,
         load_summary=load_summary,
+        import_report=import_report,
         construction_banner_enabled=construction_banner_enabled(),
         active_section=section,
         deepseek_api_key=get_deepseek_api_key(),
@@ -3136,7 +5527,39 @@ def render_admin_page(message=None, save_summary=None, load_summary=None, sectio
 def admin():
     message = request.args.get("message")
     section = request.args.get("section")
-    return render_admin_page(message=message, section=section)
+    import_report = None
+    import_job_id = request.args.get("import_job")
+    if import_job_id:
+        job = load_import_job(import_job_id)
+        if not job:
+            message = "Import job not found."
+        elif job["status"] in {"done", "failed"}:
+            # Finished jobs replace the "importing in the background" notice
+            message = job["message"]
+            import_report = job["report"] or None
+    return render_admin_page(message=message, section=section, import_report=import_report)
+
+
+@app.route("/admin/metrics")
+def admin_metrics():
+    return {
+        "covers_cache": cover_cache_summary(),
+        "cover_prefetch": cover_prefetch_summary(),
+        "deepseek": deepseek_summary(),
+        "http": http_summary(),
+        "moderation_batches": moderation_batch_summary(),
+        "moderation_cache": moderation_cache_summary(),
+        "moderation_local": moderation_local_summary(),
+        "scrape_cache": scrape_cache_summary(),
+    }
+
+
+@app.route("/admin/books/warm-covers", methods=["POST"])
+def warm_book_covers():
+    queued = prefetch_covers(load_books())
+    return redirect(
+        url_for("admin", message=f"Warming {queued} book covers in the background.", section="books")
+    )
 
 
 @app.route("/admin/contact-messages/<int:message_id>/complete", methods=["POST"])
@@ -3856,19 +6279,79 @@ def snapshot_load():
 
 @app.route("/admin/books/scrape", methods=["POST"])
 def scrape_book():
+    wants_json = request.accept_mimetypes.best_match(["text/html", "application/json"]) == "application/json"
     book_url = request.form.get("book_url", "").strip()
     if not book_url:
+        if wants_json:
+            return {"error": "Please provide a book URL to scrape."}, 400
         return redirect(url_for("admin", message="Please provide a book URL to scrape."))
 
-    book, error = scrape_book_metadata(book_url)
-    if error:
-        return redirect(url_for("admin", message=error))
+    job_id = enqueue_scrape_job(book_url, force_refresh=request.form.get("force_refresh") == "on")
+    if wants_json:
+        return {"job_id": job_id, "status_url": url_for("scrape_job_status", job_id=job_id)}, 202
 
-    books = load_books()
-    books.append(book)
-    save_books(books)
+    return redirect(
+        url_for(
+            "admin",
+            message="Scraping in the background. Refresh in a moment to see the book.",
+            section="books",
+        )
+    )
+
+
+@app.route("/admin/books/import", methods=["POST"])
+def import_books():
+    wants_json = request.accept_mimetypes.best_match(["text/html", "application/json"]) == "application/json"
+    upload = request.files.get("import_file")
+    text = upload.read().decode("utf-8", errors="replace") if upload else ""
+    urls = parse_import_urls("\n".join(filter(None, [text, request.form.get("book_urls", "")])))
+    if not urls:
+        if wants_json:
+            return {"error": "No book URLs found to import."}, 400
+        return redirect(url_for("admin", message="No book URLs found to import.", section="books"))
+
+    job_id = enqueue_import_job(urls, force_refresh=request.form.get("force_refresh") == "on")
+    if wants_json:
+        return {"job_id": job_id, "status_url": url_for("import_job_status", job_id=job_id)}, 202
+
+    return redirect(
+        url_for(
+            "admin",
+            message=f"Importing {len(urls)} book URLs in the background. Refresh in a moment to see the results.",
+            section="books",
+            import_job=job_id,
+        )
+    )
+
+
+@app.route("/admin/books/import/<job_id>")
+def import_job_status(job_id):
+    job = load_import_job(job_id)
+    if not job:
+        return {"error": "Import job not found."}, 404
+    return job
+
+
+@app.cli.command("import-books")
+@click.argument("source", type=click.File("r"))
+@click.option("--workers", default=BULK_IMPORT_WORKERS, show_default=True, help="Concurrent scrapes.")
+@click.option("--force-refresh", is_flag=True, help="Ignore cached scrape results.")
+def import_books_command(source, workers, force_refresh):
+    """Import books from a CSV or newline list of URLs (use - for stdin)."""
 
-    return redirect(url_for("admin", message="Book scraped and added.", section="books"))
+    urls = parse_import_urls(source.read())
+    report = bulk_import_books(urls, workers=workers, force_refresh=force_refresh)
+    for entry in report:
+        click.echo(f"{entry['status']:<9} {entry['url']}  {entry['message']}")
+    click.echo(import_report_summary(report))
+
+
+@app.route("/admin/books/scrape/<job_id>")
+def scrape_job_status(job_id):
+    job = load_scrape_job(job_id)
+    if not job:
+        return {"error": "Scrape job not found."}, 404
+    return job
 
 
 @app.route("/admin/books", methods=["POST"])
@@ -3885,8 +6368,7 @@ def add_book():
     if not all([title, author, description, affiliate_url]):
         return redirect(url_for("admin", message="Please fill in all book fields."))
 
-    books = load_books()
-    books.append(
+    insert_book(
         {
             "title": title,
             "author": author,
@@ -3895,7 +6377,6 @@ def add_book():
             "cover_url": cover_url,
         }
     )
-    save_books(books)
     return redirect(url_for("admin", message="Book added.", section="books"))
 
 
@@ -3903,8 +6384,7 @@ def add_book():
 def delete_book(book_index):
     books = load_books()
     if 0 <= book_index < len(books):
-        books.pop(book_index)
-        save_books(books)
+        delete_book_record(books[book_index])
         return redirect(url_for("admin", message="Book removed.", section="books"))
     return redirect(url_for("admin", message="Book not found.", section="books"))
 
@@ -3940,14 +6420,19 @@ def update_book(book_index):
     if not all([title, author, description, affiliate_url]):
         return redirect(url_for("admin", message="Please complete all book fields to update."))
 
-    books[book_index] = {
-        "title": title,
-        "author": author,
-        "description": description,
-        "affiliate_url": affiliate_url,
-        "cover_url": cover_url,
-    }
-    save_books(books)
+    updated, error = update_book_record(
+        existing_book,
+        {
+            "title": title,
+            "author": author,
+            "description": description,
+            "affiliate_url": affiliate_url,
+            "cover_url": cover_url,
+        },
+    )
+    if not updated:
+        return redirect(url_for("admin", message=error, section="books"))
+
     return redirect(url_for("admin", message="Book updated.", section="books"))
 
 
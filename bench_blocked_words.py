@@ -0,0 +1,84 @@
+"""Compare the compiled blocked-words matcher with a per-phrase substring scan.
+
+Usage: ``python bench_blocked_words.py [--phrases 5000] [--messages 2000]``.
+"""
+
+import argparse
+import random
+import string
+import time
+
+import app
+
+
+# Benign sentences that contain blocked words only across word boundaries.
+BOUNDARY_SENTENCES = [
+    ("die", "I was so sad, I even cried"),
+    ("sex", "it does excel at that"),
+    ("kill myself", "I'll skill up myself"),
+    ("self harm", "be yourself, harmless fun"),
+]
+
+
+def random_phrase(rng):
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+    return " ".join(words)
+
+
+def naive_contains(message, phrases):
+    lowered = message.lower().strip()
+    return any(phrase in lowered for phrase in phrases)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--phrases", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    phrases = sorted({random_phrase(rng) for _ in range(args.phrases)})
+    blocked_words = ",".join(phrases)
+    messages = []
+    for index in range(args.messages):
+        words = [random_phrase(rng) for _ in range(rng.randint(3, 12))]
+        if index % 10 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice(phrases))
+        messages.append(" ".join(words))
+
+    started = time.perf_counter()
+    patterns = app.compile_blocked_words(blocked_words)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    naive = [naive_contains(message, phrases) for message in messages]
+    naive_us = (time.perf_counter() - started) * 1e6 / len(messages)
+
+    started = time.perf_counter()
+    compiled = [app.contains_blocked_words(message, patterns) for message in messages]
+    compiled_us = (time.perf_counter() - started) * 1e6 / len(messages)
+
+    missed = sum(1 for old, new in zip(naive, compiled) if old and not new)
+    added = sum(1 for old, new in zip(naive, compiled) if new and not old)
+    boundary = [
+        sentence
+        for phrase, sentence in BOUNDARY_SENTENCES
+        if app.contains_blocked_words(sentence, app.compile_blocked_words(phrase))
+        and not naive_contains(sentence, [phrase])
+    ]
+    print(f"phrases:            {len(phrases)}")
+    print(f"messages:           {len(messages)} ({sum(naive)} blocked by the substring scan)")
+    print(f"compile:            {compile_ms:.1f} ms")
+    print(f"substring scan:     {naive_us:.1f} us/message")
+    print(f"compiled matcher:   {compiled_us:.1f} us/message")
+    print(f"speed-up:           {naive_us / compiled_us:.1f}x")
+    print(f"missed vs scan:     {missed}")
+    print(f"added vs scan:      {added}")
+    print(f"cross-word matches: {len(boundary)} of {len(BOUNDARY_SENTENCES)} benign sentences")
+    for sentence in boundary:
+        print(f"  false positive:   {sentence!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure cold-start import time and resident memory of an app worker.
+
+Each run imports ``app`` in a fresh interpreter so nothing is shared between
+samples.  Usage: ``python bench_startup.py [--runs 10]``.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("selenium", "requests", "PIL", "mimetypes")
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app
+elapsed = time.perf_counter() - started
+rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "max_rss_mib": rss_kib / 1024,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_probe():
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=here,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [run_probe() for _ in range(max(1, args.runs))]
+    import_times = [sample["import_ms"] for sample in samples]
+    rss = [sample["max_rss_mib"] for sample in samples]
+
+    print(f"runs:           {len(samples)}")
+    print(f"import median:  {statistics.median(import_times):.1f} ms")
+    print(f"import min/max: {min(import_times):.1f} / {max(import_times):.1f} ms")
+    print(f"max RSS median: {statistics.median(rss):.1f} MiB")
+    print(f"heavy modules loaded at import: {', '.join(samples[-1]['loaded']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
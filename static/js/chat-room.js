@@ -636,6 +636,49 @@
     return reply;
   }
 
+  // Read Server-Sent Events from a streamed POST, calling onEvent(name, data) per event.
+  // Resolves once the stream ends or onEvent returns false (which cancels the stream).
+  async function readEventStream(url, body, onEvent) {
+    const response = await fetch(url, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+      body: JSON.stringify(body),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Reply stream failed (${response.status})`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        const frame = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+
+        let eventName = 'message';
+        const dataLines = [];
+        frame.split('\n').forEach((line) => {
+          if (line.startsWith('event:')) eventName = line.slice(6).trim();
+          else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+        });
+        if (!dataLines.length) continue;
+
+        if (onEvent(eventName, JSON.parse(dataLines.join('\n'))) === false) {
+          reader.cancel();
+          return;
+        }
+      }
+    }
+  }
+
   async function requestReplies(userMessage, { warmup = false } = {}) {
     // Pause background chat while responding to user
     pauseBackgroundChat();
@@ -657,68 +700,51 @@
         return;
       }
       
-      // Show typing for realistic duration (longer for longer responses)
-      const typingDuration = 1500 + Math.random() * 2500;
+      // Typing shows until the first streamed message arrives
       if (typingBar && typingCopy) {
         typingCopy.textContent = `${randomPeer.name} is typing…`;
         typingBar.hidden = false;
       }
 
-      try {
-        const response = await fetch('/api/chat/reply', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            message: userMessage,
-            history: chatHistory,
-            warmup,
-            replyToUser: true,
-            peerNames: getCurrentPeerNames(),
-            participants: getCurrentPeerNames(), // Send participant names for @mentions
-            uniqueSession: Date.now(), // Force unique responses
-          }),
-        });
-
-        const result = await response.json();
+      let replied = false;
+      const reply = (msg) => {
+        if (replied) return;
+        replied = true;
+        hideTyping();
+        addMessage(msg);
+        // Resume background chat after responding
+        resumeBackgroundChat();
+      };
+      // API failed - use a fallback reply so user isn't ignored
+      const fallbackReply = () => reply({
+        sender: randomPeer.name,
+        role: 'peer',
+        text: getRandomFallbackReply(randomPeer.name)
+      });
 
-        const messages = Array.isArray(result.messages) ? result.messages : [];
-        
-        // Show typing then message after delay
-        setTimeout(() => {
-          hideTyping();
-          
-          if (messages.length > 0 && !result.error) {
-            // Use the API response with our peer name
-            const msg = messages[0];
-            msg.sender = randomPeer.name;
-            addMessage(msg);
-          } else {
-            // API failed - use a fallback reply so user isn't ignored
-            addMessage({
-              sender: randomPeer.name,
-              role: 'peer',
-              text: getRandomFallbackReply(randomPeer.name)
-            });
+      try {
+        await readEventStream('/api/chat/reply/stream', {
+          message: userMessage,
+          history: chatHistory,
+          warmup,
+          replyToUser: true,
+          peerNames: getCurrentPeerNames(),
+          participants: getCurrentPeerNames(), // Send participant names for @mentions
+          uniqueSession: Date.now(), // Force unique responses
+        }, (eventName, data) => {
+          if (eventName === 'message' && data && data.text) {
+            // Use the first streamed message with our peer name, then stop reading
+            reply({ ...data, sender: randomPeer.name });
+            return false;
           }
-          
-          // Resume background chat after responding
-          resumeBackgroundChat();
-        }, typingDuration);
-        
+          return eventName !== 'error' && eventName !== 'done';
+        });
       } catch (error) {
         // API error - still give a response so user isn't ignored
         console.log('Chat reply error, using fallback:', error.message);
-        
-        setTimeout(() => {
-          hideTyping();
-          addMessage({
-            sender: randomPeer.name,
-            role: 'peer',
-            text: getRandomFallbackReply(randomPeer.name)
-          });
-          resumeBackgroundChat();
-        }, typingDuration);
       }
+
+      if (!replied) fallbackReply();
     }, totalDelayBeforeTyping);
   }
 
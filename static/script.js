@@ -18,6 +18,8 @@ const bookModalCoverFallback = document.querySelector('[data-book-modal-cover-fa
 const bookModalLinks = Array.from(document.querySelectorAll('[data-book-modal-link]'));
 const bookTriggerButtons = Array.from(document.querySelectorAll('[data-book-trigger]'));
 const bookCards = Array.from(document.querySelectorAll('.book-card[data-book-index]'));
+const bookGrid = document.querySelector('[data-book-grid]');
+const bookGridSentinel = document.querySelector('[data-book-grid-sentinel]');
 const bookModalCloseButtons = Array.from(document.querySelectorAll('[data-book-modal-close]'));
 const adminBookModal = document.querySelector('[data-admin-book-modal]');
 const adminBookForm = document.querySelector('[data-admin-book-form]');
@@ -336,10 +338,181 @@ function closeBookModal() {
   updateBodyModalLock();
 }
 
-bookTriggerButtons.forEach((button) => {
+function bindBookTrigger(button) {
   button.addEventListener('click', () => {
     openBookModalFromCard(button.closest('.book-card'), button);
   });
+}
+
+bookTriggerButtons.forEach(bindBookTrigger);
+
+function buildBookCard(book, index) {
+  const card = document.createElement('article');
+  card.className = 'book-card';
+  card.dataset.bookIndex = String(index);
+  card.dataset.bookSlug = book.slug || '';
+  card.dataset.bookTitle = book.title || '';
+  card.dataset.bookAuthor = book.author || '';
+  card.dataset.bookDescription = book.description || '';
+  card.dataset.bookCover = book.cover_src || '';
+  card.dataset.bookLink = book.affiliate_url || '';
+
+  const cover = document.createElement('div');
+  cover.className = 'book-cover';
+  cover.setAttribute('aria-hidden', 'true');
+  const image = document.createElement('img');
+  image.src = book.cover_src || '';
+  if (book.cover_srcset) {
+    image.srcset = book.cover_srcset;
+    image.sizes = '110px';
+  }
+  image.alt = `${book.title || 'Book'} cover`;
+  image.loading = 'lazy';
+  cover.appendChild(image);
+
+  const meta = document.createElement('div');
+  meta.className = 'book-meta';
+  const metaHeader = document.createElement('div');
+  metaHeader.className = 'book-meta-header';
+  const author = document.createElement('p');
+  author.className = 'eyebrow';
+  author.textContent = book.author || '';
+  metaHeader.appendChild(author);
+  meta.appendChild(metaHeader);
+  if (book.is_most_viewed) {
+    const pill = document.createElement('span');
+    pill.className = 'pill tiny';
+    pill.textContent = 'Most Viewed';
+    meta.appendChild(pill);
+  }
+  const title = document.createElement('h3');
+  title.textContent = book.title || '';
+  const description = document.createElement('p');
+  description.className = 'body book-description';
+  description.textContent = book.description || '';
+  meta.append(title, description);
+
+  const actions = document.createElement('div');
+  actions.className = 'book-actions';
+  const trigger = document.createElement('button');
+  trigger.className = 'btn tiny';
+  trigger.type = 'button';
+  trigger.dataset.bookTrigger = '';
+  trigger.setAttribute('aria-expanded', 'false');
+  trigger.textContent = 'View book';
+  bindBookTrigger(trigger);
+  const halo = document.createElement('div');
+  halo.className = 'halo';
+  actions.append(trigger, halo);
+
+  card.append(cover, meta, actions);
+  return card;
+}
+
+let bookPageLoading = false;
+
+async function loadNextBookPage(observer) {
+  const cursor = bookGrid?.dataset.nextCursor;
+  if (!bookGrid || !cursor || bookPageLoading) return;
+
+  bookPageLoading = true;
+  try {
+    const response = await fetch(`/api/books?cursor=${encodeURIComponent(cursor)}`, {
+      headers: { Accept: 'application/json' },
+    });
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const payload = await response.json();
+    let index = bookGrid.querySelectorAll('.book-card').length;
+    (payload.books || []).forEach((book) => {
+      bookGrid.appendChild(buildBookCard(book, index));
+      index += 1;
+    });
+    bookGrid.dataset.nextCursor = payload.next_cursor || '';
+  } catch (error) {
+    console.warn('Could not load more books', error);
+    bookGrid.dataset.nextCursor = '';
+  } finally {
+    bookPageLoading = false;
+  }
+
+  if (!observer) return;
+  observer.unobserve(bookGridSentinel);
+  if (bookGrid.dataset.nextCursor) {
+    // Re-observing fires again straight away if the sentinel is still in view.
+    observer.observe(bookGridSentinel);
+  }
+}
+
+if (bookGrid && bookGridSentinel && bookGrid.dataset.nextCursor) {
+  if ('IntersectionObserver' in window) {
+    const bookPageObserver = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          loadNextBookPage(bookPageObserver);
+        }
+      },
+      { rootMargin: '600px 0px' }
+    );
+    bookPageObserver.observe(bookGridSentinel);
+  } else {
+    (async () => {
+      while (bookGrid.dataset.nextCursor) {
+        await loadNextBookPage();
+      }
+    })();
+  }
+}
+
+const scrapeForms = document.querySelectorAll('[data-scrape-form]');
+
+function setScrapeStatus(form, text) {
+  const status = form.querySelector('[data-scrape-status]');
+  if (status) status.textContent = text;
+}
+
+async function pollScrapeJob(form, statusUrl) {
+  for (;;) {
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+    const response = await fetch(statusUrl, { headers: { Accept: 'application/json' } });
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const job = await response.json();
+    if (job.status === 'done' || job.status === 'failed') return job;
+    setScrapeStatus(form, job.status === 'running' ? 'Scraping…' : 'Waiting for a free scraper…');
+  }
+}
+
+scrapeForms.forEach((scrapeForm) => {
+  scrapeForm.addEventListener('submit', async (event) => {
+    event.preventDefault();
+    const submitButton = scrapeForm.querySelector('button[type="submit"]');
+    if (submitButton) submitButton.disabled = true;
+    setScrapeStatus(scrapeForm, 'Queued…');
+
+    try {
+      const response = await fetch(scrapeForm.action, {
+        method: 'POST',
+        body: new FormData(scrapeForm),
+        headers: { Accept: 'application/json' },
+      });
+      const payload = await response.json();
+      if (!response.ok) throw new Error(payload.error || `HTTP ${response.status}`);
+
+      const job = await pollScrapeJob(scrapeForm, payload.status_url);
+      if (job.status === 'done') {
+        const doneUrl = new URL(scrapeForm.dataset.scrapeDoneUrl, window.location.href);
+        doneUrl.searchParams.set('message', job.message);
+        // Forms whose results render on the admin page pass the finished job id along
+        if (scrapeForm.dataset.scrapeDoneParam) doneUrl.searchParams.set(scrapeForm.dataset.scrapeDoneParam, job.id);
+        window.location.assign(doneUrl);
+        return;
+      }
+      setScrapeStatus(scrapeForm, job.message || 'Scrape failed.');
+    } catch (error) {
+      setScrapeStatus(scrapeForm, `Could not scrape: ${error.message}`);
+    } finally {
+      if (submitButton) submitButton.disabled = false;
+    }
+  });
 });
 
 bookModalCloseButtons.forEach((button) => button.addEventListener('click', closeBookModal));